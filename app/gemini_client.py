@@ -3,24 +3,174 @@ Gemini Client using the new google.genai SDK
 Implements FileSearchStore API for document search and retrieval
 """
 import google.genai as genai
-from typing import Optional, List, Dict, Any
-import json
+from google.genai import errors as genai_errors
+from google.genai import types as genai_types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, BinaryIO, Callable, Iterable, Iterator, Tuple, TypedDict, cast
+import io
+import itertools
 import mimetypes
+import operator
 import os
-from pathlib import Path
+import random
+import sys
+import threading
 import time
 
+from cachetools import TTLCache
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 
 from app.logger import get_logger
 
 BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
 UPLOAD_BASE_URL = "https://generativelanguage.googleapis.com/upload/v1beta"
+STORES_URL = f"{BASE_URL}/fileSearchStores"
 DEFAULT_TIMEOUT = 30
 UPLOAD_TIMEOUT = 120
+MAX_CONCURRENT_REQUESTS = 8
+METADATA_CACHE_TTL = 30.0
+FILE_CACHE_TTL = 60.0
+SEARCH_CACHE_TTL = 300.0
+# Largest page the list endpoints will return (the server default is 10)
+MAX_PAGE_SIZE = 20
+# Transport retries for REST calls. Every call sits on a user's request, so waits are capped
+# (Retry-After included) to keep the worst case around half a minute rather than minutes.
+MAX_RETRIES = 3
+MAX_RETRY_WAIT = 10.0
 
-mimetypes.add_type("text/plain", ".md")
-mimetypes.add_type("text/plain", ".markdown")
+# Markdown is served to the API as plain text; registered lazily so importing this module
+# does not force mimetypes to read the system mime.types files
+_MIME_OVERRIDES = {".md": "text/plain", ".markdown": "text/plain"}
+_mime_types_registered = False
+
+
+_loads = orjson.loads
+_dumps = orjson.dumps
+
+
+class _TransientRetry(Retry):
+    """Retry policy that also retries POST, but only when the server refused it with 429"""
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        # A long Retry-After would otherwise hold the request (and its worker) for that long
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_WAIT)
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            # A 5xx on create/import may already have been applied; a 429 never was
+            return status_code == 429 and self.total != 0
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _is_expected_error(error: Optional[BaseException]) -> bool:
+    # Caller mistakes (missing file, 4xx from REST or the SDK) are reported, not debugged
+    if isinstance(error, (FileNotFoundError, genai_errors.ClientError)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return 400 <= error.response.status_code < 500
+    return False
+
+
+@lru_cache(maxsize=None)
+def _supports_file_search_stores(client_type: type) -> bool:
+    # SDK services are class-level properties, so the probe depends only on the installed SDK
+    return hasattr(client_type, "file_search_stores")
+
+
+def _ensure_mime_types() -> None:
+    global _mime_types_registered
+    if not _mime_types_registered:
+        for extension, mime_type in _MIME_OVERRIDES.items():
+            mimetypes.add_type(mime_type, extension)
+        _mime_types_registered = True
+
+
+def _backoff_sleep(delay: float, deadline: float, max_interval: float) -> float:
+    # Sleep for delay plus up to 10% jitter, never past the deadline; return the next delay
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(min(delay + random.uniform(0, delay * 0.1), remaining))
+    return min(delay * 1.7, max_interval)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_mime(extension: str) -> str:
+    # Keyed on the lowercased extension only, so every upload of the same kind hits the cache
+    return (
+        _MIME_OVERRIDES.get(extension)
+        or mimetypes.guess_type(f"file{extension}")[0]
+        or "application/octet-stream"
+    )
+
+
+def _stream_mime(display_name: str, mime_type: Optional[str]) -> str:
+    # The extension decides (so markdown maps to text/plain); the client's type fills unknown ones
+    resolved = _resolve_mime(os.path.splitext(display_name)[1].lower())
+    if resolved == "application/octet-stream" and mime_type:
+        return mime_type
+    return resolved
+
+
+class _StreamBody:
+    """Seekable stream that reports its unread length, as MultipartEncoder expects of a custom body
+
+    Passing the stream itself would make the encoder call fileno() (which rolls a spooled
+    upload over to disk) or getvalue() (which copies an in-memory one).
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        position = stream.tell()
+        self._end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+
+    @property
+    def len(self) -> int:
+        return self._end - self._stream.tell()
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+
+class _SDKStream(io.IOBase):
+    """io.IOBase view of a seekable binary stream, for SDK uploads that only accept IOBase or a path
+
+    Werkzeug's SpooledTemporaryFile is an IOBase only from Python 3.11; closing the view leaves
+    the wrapped stream open.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+
+def _sdk_stream(stream: BinaryIO) -> io.IOBase:
+    return stream if isinstance(stream, io.IOBase) else _SDKStream(stream)
+
+
+def _json_loads(response: requests.Response) -> Any:
+    return _loads(response.content)
 
 
 def _as_int(value: Any, default: int = 0) -> int:
@@ -32,11 +182,131 @@ def _as_int(value: Any, default: int = 0) -> int:
         return default
 
 
-def _pick(data: Dict[str, Any], *keys: str) -> Any:
-    for key in keys:
-        if key in data and data[key] is not None:
-            return data[key]
-    return None
+class StoreInfo(TypedDict):
+    """Normalised FileSearchStore record shared by the REST and SDK paths"""
+    store_name: Optional[str]
+    display_name: Optional[str]
+    create_time: Optional[str]
+    update_time: Optional[str]
+    active_documents_count: int
+    pending_documents_count: int
+    failed_documents_count: int
+    size_bytes: int
+
+
+class DocumentInfo(TypedDict):
+    """Normalised FileSearchStore document record shared by the REST and SDK paths"""
+    document_name: Optional[str]
+    display_name: Optional[str]
+    mime_type: Optional[str]
+    create_time: Optional[str]
+    update_time: Optional[str]
+    size_bytes: Optional[int]
+    file_id: Optional[str]
+
+
+# Output key -> accepted REST/SDK spellings, resolved in order
+_STORE_FIELDS = (
+    ("store_name", ("name", "store_name", "storeName")),
+    ("display_name", ("displayName", "display_name")),
+    ("create_time", ("createTime", "create_time")),
+    ("update_time", ("updateTime", "update_time")),
+    ("active_documents_count", ("activeDocumentCount", "activeDocumentsCount", "active_documents_count")),
+    ("pending_documents_count", ("pendingDocumentCount", "pendingDocumentsCount", "pending_documents_count")),
+    ("failed_documents_count", ("failedDocumentCount", "failedDocumentsCount", "failed_documents_count")),
+    ("size_bytes", ("sizeBytes", "size_bytes")),
+)
+_DOCUMENT_FIELDS = (
+    ("document_name", ("name", "document_name", "documentName")),
+    ("display_name", ("displayName", "display_name")),
+    ("mime_type", ("mimeType", "mime_type")),
+    ("create_time", ("createTime", "create_time")),
+    ("update_time", ("updateTime", "update_time")),
+    ("size_bytes", ("sizeBytes", "size_bytes")),
+    ("file_id", ("file", "fileId", "file_id", "fileName", "file_name", "source")),
+)
+_FILE_REF_FIELDS = (
+    ("file_id", ("name", "fileId", "file_id", "id", "file")),
+)
+_FILES_LIST_KEY = ("files",)
+_CITATION_SOURCE_KEYS = ("uri", "url", "source", "sourceId", "document", "name")
+_CITATION_TEXT_KEYS = ("snippet", "text", "content", "title")
+_CONTEXT_TEXT_KEYS = ("text", "snippet", "content", "title")
+_TIME_FIELDS = ("create_time", "update_time")
+_STORE_COUNT_FIELDS = ("active_documents_count", "pending_documents_count", "failed_documents_count", "size_bytes")
+
+
+def _select_fields(data: Dict[str, Any], fields: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Dict[str, Any]:
+    get = data.get
+    result: Dict[str, Any] = {}
+    for out_key, aliases in fields:
+        value = None
+        for alias in aliases:
+            value = get(alias)
+            if value is not None:
+                break
+        result[out_key] = value
+    return result
+
+
+def _sdk_time(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
+
+
+def _sdk_count(value: Any) -> int:
+    return int(value) if value is not None else 0
+
+
+def _store_from_sdk(store: Any) -> StoreInfo:
+    # One getattr per field instead of hasattr + attribute access
+    return {
+        "store_name": store.name,
+        "display_name": store.display_name,
+        "create_time": _sdk_time(getattr(store, "create_time", None)),
+        "update_time": _sdk_time(getattr(store, "update_time", None)),
+        "active_documents_count": _sdk_count(getattr(store, "active_documents_count", None)),
+        "pending_documents_count": _sdk_count(getattr(store, "pending_documents_count", None)),
+        "failed_documents_count": _sdk_count(getattr(store, "failed_documents_count", None)),
+        "size_bytes": _sdk_count(getattr(store, "size_bytes", None)),
+    }
+
+
+def _document_from_sdk(doc: Any) -> DocumentInfo:
+    file_ref = getattr(doc, "file", None)
+    file_id = file_ref if isinstance(file_ref, str) else getattr(file_ref, "name", None)
+    if not file_id:
+        file_id = getattr(doc, "file_id", None) or getattr(doc, "file_name", None)
+
+    return {
+        "document_name": getattr(doc, "name", None),
+        "display_name": getattr(doc, "display_name", None),
+        "mime_type": getattr(doc, "mime_type", None),
+        "create_time": _sdk_time(getattr(doc, "create_time", None)),
+        "update_time": _sdk_time(getattr(doc, "update_time", None)),
+        "size_bytes": getattr(doc, "size_bytes", None),
+        "file_id": file_id,
+    }
+
+
+# types.File is a pydantic model that always defines these fields, so one C-level attrgetter
+# call replaces a getattr per field
+_file_attrs = operator.attrgetter(
+    "name", "display_name", "mime_type", "size_bytes", "create_time", "update_time", "uri", "state"
+)
+
+
+def _file_from_sdk(file: Any) -> Dict[str, Any]:
+    name, display_name, mime_type, size_bytes, create_time, update_time, uri, state = _file_attrs(file)
+    return {
+        "file_id": name,
+        "display_name": display_name,
+        "mime_type": mime_type,
+        "size_bytes": size_bytes,
+        "create_time": _sdk_time(create_time),
+        "update_time": _sdk_time(update_time),
+        "uri": uri,
+        "state": state.name if state is not None else None,
+    }
 
 
 class GeminiClient:
@@ -52,28 +322,121 @@ class GeminiClient:
         self.api_key = api_key
         self.logger = get_logger()
 
-        # Configure the client with API key
-        self.client = genai.Client(api_key=api_key)        
-        self.logger.info("GeminiClient initialized successfully")
-
-    def _supports_file_search_stores(self) -> bool:
-        return hasattr(self.client, "file_search_stores")
-
-    def _is_bearer_token(self) -> bool:
-        return isinstance(self.api_key, str) and self.api_key.lower().startswith("bearer ")
+        # Configure the client with API key. The SDK talks to the Files API over httpx;
+        # HTTP/2 lets concurrent uploads/lookups multiplex over one TLS connection.
+        self.client = genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(
+                client_args={
+                    "http2": True,
+                    "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                },
+            ),
+        )
 
-    def _rest_params(self) -> Dict[str, str]:
-        if self._is_bearer_token():
-            return {}
-        return {"key": self.api_key}
+        # Capabilities and auth material never change after construction; compute them once
+        self._has_fss = _supports_file_search_stores(type(self.client))
+        self._bearer = isinstance(api_key, str) and api_key[:7].lower() == "bearer "
+        self._base_params: Dict[str, str] = {} if self._bearer else {"key": api_key}
+        self._auth_headers: Dict[str, str] = {"Authorization": api_key} if self._bearer else {}
+        self._json_headers: Dict[str, str] = {**self._auth_headers, "Content-Type": "application/json"}
+
+        # Pooled keep-alive session for REST calls; every request targets the same host. One client
+        # serves a whole gevent worker, so the pool is sized for many concurrent routes, not just
+        # MAX_CONCURRENT_REQUESTS; connections beyond it would be closed after each call.
+        self._session = requests.Session()
+        self._retry = _TransientRetry(
+            total=MAX_RETRIES,
+            backoff_factor=0.5,
+            backoff_max=MAX_RETRY_WAIT,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=64, max_retries=self._retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # Multipart uploads stream their body and the transport cannot rewind it, so a transport
+        # retry would resend the headers with an empty body; _post_upload retries them itself
+        self._upload_session = requests.Session()
+        upload_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_CONCURRENT_REQUESTS, max_retries=0)
+        self._upload_session.mount("http://", upload_adapter)
+        self._upload_session.mount("https://", upload_adapter)
+
+        # Short-lived caches of successful store/document responses, invalidated on mutation
+        self._cache_lock = threading.Lock()
+        self._store_cache: TTLCache = TTLCache(maxsize=1024, ttl=METADATA_CACHE_TTL)
+        self._list_cache: TTLCache = TTLCache(maxsize=256, ttl=METADATA_CACHE_TTL)
+        # Raw generateContent responses keyed by (query, sorted stores, metadata filter, model)
+        self._search_cache: TTLCache = TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL)
+        # Per-store multipart upload endpoints, built on first use
+        self._upload_urls: Dict[str, str] = {}
+        # Files API metadata keyed by file id, plus the last list_files snapshot under _FILES_LIST_KEY
+        self._file_cache: TTLCache = TTLCache(maxsize=10_000, ttl=FILE_CACHE_TTL)
+        self.logger.info("GeminiClient initialized successfully")
 
-    def _rest_headers(self, json_body: bool = False) -> Dict[str, str]:
-        headers: Dict[str, str] = {}
-        if self._is_bearer_token():
-            headers["Authorization"] = self.api_key
-        if json_body:
-            headers["Content-Type"] = "application/json"
-        return headers
+    def close(self) -> None:
+        """Release pooled REST connections"""
+        self._session.close()
+
+    def __enter__(self) -> "GeminiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _cache_get(self, cache: TTLCache, key: Any) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            cached = cache.get(key)
+        return dict(cached) if cached is not None else None
+
+    def _cache_put(self, cache: TTLCache, key: Any, result: Dict[str, Any]) -> None:
+        if result.get("success"):
+            with self._cache_lock:
+                cache[key] = dict(result)
+
+    def _invalidate_store(self, store_name: Optional[str] = None) -> None:
+        # Drop every store listing plus the entry and document pages of the given store
+        with self._cache_lock:
+            if store_name:
+                self._store_cache.pop(store_name, None)
+            for key in list(self._list_cache.keys()):
+                if key[0] == "stores" or (store_name and key[1] == store_name):
+                    self._list_cache.pop(key, None)
+            if store_name:
+                # Answers grounded in this store may change with its documents
+                for key in list(self._search_cache.keys()):
+                    if store_name in key[1]:
+                        self._search_cache.pop(key, None)
+
+    def _remember_files(self, files: List[Dict[str, Any]]) -> None:
+        # Files still being processed change state shortly, so only settled ones are cached
+        with self._cache_lock:
+            for info in files:
+                if info.get("state") != "PROCESSING":
+                    self._file_cache[info["file_id"]] = {"success": True, **info}
+
+    def _invalidate_files(self, file_id: Optional[str] = None) -> None:
+        with self._cache_lock:
+            self._file_cache.pop(_FILES_LIST_KEY, None)
+            if file_id:
+                self._file_cache.pop(file_id, None)
+
+    def invalidate_all(self) -> None:
+        """Discard all cached store, document and file metadata"""
+        with self._cache_lock:
+            self._store_cache.clear()
+            self._list_cache.clear()
+            self._file_cache.clear()
+            self._search_cache.clear()
+
+    def _log_exception(self, msg: str, *args: Any) -> None:
+        # Like logger.exception, but expected failures are logged as warnings without a traceback
+        if _is_expected_error(sys.exc_info()[1]):
+            self.logger.warning(msg, *args, stacklevel=2)
+        else:
+            self.logger.error(msg, *args, exc_info=True, stacklevel=2)
 
     def _rest_request(
         self,
@@ -82,77 +445,220 @@ class GeminiClient:
         *,
         json_body: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, str]] = None,
-        files: Optional[Dict[str, Any]] = None,
+        multipart: Optional[MultipartEncoder] = None,
         timeout: int = DEFAULT_TIMEOUT,
     ) -> requests.Response:
-        request_params = self._rest_params()
-        if params:
-            request_params.update(params)
-
-        headers = self._rest_headers(json_body=json_body is not None and files is None)
-        return requests.request(
+        request_params = {**self._base_params, **params} if params else self._base_params
+        if multipart is not None:
+            # The encoder is read incrementally while sending, so the body is never held in memory
+            headers = {**self._auth_headers, "Content-Type": multipart.content_type}
+            body: Any = multipart
+        elif json_body is not None:
+            headers = self._json_headers
+            body = _dumps(json_body)
+        else:
+            headers = self._auth_headers
+            body = None
+        session = self._upload_session if multipart is not None else self._session
+        return session.request(
             method,
             url,
             params=request_params,
             headers=headers,
-            json=json_body,
-            files=files,
+            data=body,
             timeout=timeout,
         )
 
-    def _poll_operation(self, operation_name: str, timeout: int = 180, interval: int = 2) -> Dict[str, Any]:
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            response = self._rest_request("GET", f"{BASE_URL}/{operation_name}")
+    def _map_concurrently(
+        self,
+        func: Callable[..., Dict[str, Any]],
+        arg_tuples: Iterable[Tuple[Any, ...]],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> List[Dict[str, Any]]:
+        # Fan independent network-bound calls out over a bounded thread pool; results keep input order
+        arg_list = list(arg_tuples)
+        if len(arg_list) <= 1:
+            return [func(*args) for args in arg_list]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(arg_list))) as pool:
+            return list(pool.map(lambda args: func(*args), arg_list))
+
+    def _poll_operation(
+        self,
+        operation_name: str,
+        timeout: int = 180,
+        initial_interval: float = 0.1,
+        max_interval: float = 5.0,
+    ) -> Dict[str, Any]:
+        # Exponential backoff with jitter: fast operations are detected quickly, long ones are polled less often
+        poll_url = f"{BASE_URL}/{operation_name}"
+        deadline = time.monotonic() + timeout
+        delay = initial_interval
+        while time.monotonic() < deadline:
+            response = self._rest_request("GET", poll_url)
             response.raise_for_status()
-            operation = response.json()
+            operation = _json_loads(response)
             if operation.get("done"):
                 if operation.get("error"):
                     error = operation["error"]
                     raise RuntimeError(error.get("message", str(error)))
                 return operation
-            time.sleep(interval)
+            delay = _backoff_sleep(delay, deadline, max_interval)
         raise TimeoutError(f"Operation {operation_name} did not complete within {timeout}s")
 
-    def _normalize_store(self, store: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "store_name": _pick(store, "name", "store_name", "storeName"),
-            "display_name": _pick(store, "displayName", "display_name"),
-            "create_time": str(_pick(store, "createTime", "create_time")) if _pick(store, "createTime", "create_time") else None,
-            "update_time": str(_pick(store, "updateTime", "update_time")) if _pick(store, "updateTime", "update_time") else None,
-            "active_documents_count": _as_int(_pick(store, "activeDocumentCount", "activeDocumentsCount", "active_documents_count")),
-            "pending_documents_count": _as_int(_pick(store, "pendingDocumentCount", "pendingDocumentsCount", "pending_documents_count")),
-            "failed_documents_count": _as_int(_pick(store, "failedDocumentCount", "failedDocumentsCount", "failed_documents_count")),
-            "size_bytes": _as_int(_pick(store, "sizeBytes", "size_bytes")),
-        }
-
-    def _normalize_document(self, doc: Dict[str, Any]) -> Dict[str, Any]:
-        file_ref = _pick(doc, "file", "fileId", "file_id", "fileName", "file_name", "source")
-        file_id = None
+    def _poll_operations(
+        self,
+        operation_names: List[str],
+        timeout: int = 180,
+        initial_interval: float = 0.1,
+        max_interval: float = 5.0,
+    ) -> Dict[str, Optional[str]]:
+        # Round-robin over pending operations, sleeping only between full passes.
+        # Returns operation name -> error message (None when the operation succeeded).
+        deadline = time.monotonic() + timeout
+        delay = initial_interval
+        pending = list(dict.fromkeys(operation_names))
+        poll_urls = {operation_name: f"{BASE_URL}/{operation_name}" for operation_name in pending}
+        outcome: Dict[str, Optional[str]] = {}
+        while pending and time.monotonic() < deadline:
+            still_pending = []
+            for operation_name in pending:
+                try:
+                    response = self._rest_request("GET", poll_urls[operation_name])
+                    response.raise_for_status()
+                    operation = _json_loads(response)
+                except Exception as e:
+                    outcome[operation_name] = str(e)
+                    continue
+                if not operation.get("done"):
+                    still_pending.append(operation_name)
+                elif operation.get("error"):
+                    error = operation["error"]
+                    outcome[operation_name] = error.get("message", str(error))
+                else:
+                    outcome[operation_name] = None
+            pending = still_pending
+            if pending:
+                delay = _backoff_sleep(delay, deadline, max_interval)
+        for operation_name in pending:
+            outcome[operation_name] = f"Operation {operation_name} did not complete within {timeout}s"
+        return outcome
+
+    def _start_import(self, file_id: str, store_name: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        # POST the REST import request and return its long-running operation name, if any
+        file_name = file_id
+        if not file_name.startswith("files/"):
+            file_name = f"files/{file_name}"
+
+        payload: Dict[str, Any] = {"fileName": file_name}
+        if metadata:
+            payload["customMetadata"] = metadata
+
+        endpoints = [
+            f"{BASE_URL}/{store_name}:importFile",
+            f"{BASE_URL}/{store_name}:import",
+        ]
+
+        last_error = None
+        for endpoint in endpoints:
+            response = self._rest_request("POST", endpoint, json_body=payload)
+            if response.ok:
+                data = _json_loads(response) if response.content else {}
+                return data.get("name")
+            last_error = f"{response.status_code} {response.text}"
+
+        raise RuntimeError(f"Import failed: {last_error}")
+
+    def _start_upload(self, file_path: str, store_name: str, file_name: str) -> Optional[str]:
+        # Multipart upload straight into the store; returns the import operation to poll, if any
+        mime_type = _resolve_mime(os.path.splitext(file_name)[1].lower())
+        with open(file_path, "rb") as file_handle:
+            response = self._post_upload(file_handle, store_name, file_name, mime_type)
+        response.raise_for_status()
+        return _json_loads(response).get("name")
+
+    def _post_upload(self, source: BinaryIO, store_name: str, file_name: str, mime_type: str) -> requests.Response:
+        upload_url = self._upload_urls.get(store_name)
+        if upload_url is None:
+            upload_url = self._upload_urls[store_name] = f"{UPLOAD_BASE_URL}/{store_name}:uploadToFileSearchStore"
+        start = source.tell()
+        for attempt in range(MAX_RETRIES + 1):
+            encoder = MultipartEncoder(fields={
+                "metadata": ("metadata", _dumps({"displayName": file_name}), "application/json"),
+                "file": (file_name, _StreamBody(source), mime_type),
+            })
+            response = self._rest_request(
+                "POST",
+                upload_url,
+                params={"uploadType": "multipart"},
+                multipart=encoder,
+                timeout=UPLOAD_TIMEOUT,
+            )
+            # Only a 429 is safe to resend: the server refused the upload without storing anything
+            if response.status_code != 429 or attempt == MAX_RETRIES:
+                return response
+            wait = self._retry.get_retry_after(response)
+            if wait is None:
+                wait = min(0.5 * 2 ** attempt, MAX_RETRY_WAIT)
+            self.logger.warning("Upload of %s rate limited; retrying in %.1fs", file_name, wait)
+            response.close()
+            source.seek(start)
+            time.sleep(wait)
+        return response
+
+    def _normalize_store(self, store: Dict[str, Any]) -> StoreInfo:
+        result = _select_fields(store, _STORE_FIELDS)
+        for key in _TIME_FIELDS:
+            value = result[key]
+            result[key] = str(value) if value else None
+        for key in _STORE_COUNT_FIELDS:
+            result[key] = _as_int(result[key])
+        return cast(StoreInfo, result)
+
+    def _normalize_document(self, doc: Dict[str, Any]) -> DocumentInfo:
+        result = _select_fields(doc, _DOCUMENT_FIELDS)
+        for key in _TIME_FIELDS:
+            value = result[key]
+            result[key] = str(value) if value else None
+        result["size_bytes"] = _as_int(result["size_bytes"])
+
+        file_ref = result["file_id"]
         if isinstance(file_ref, dict):
-            file_id = _pick(file_ref, "name", "fileId", "file_id", "id", "file")
-        elif isinstance(file_ref, str):
-            file_id = file_ref
+            result["file_id"] = _select_fields(file_ref, _FILE_REF_FIELDS)["file_id"]
+        elif not isinstance(file_ref, str):
+            result["file_id"] = None
+        return cast(DocumentInfo, result)
 
-        return {
-            "document_name": _pick(doc, "name", "document_name", "documentName"),
-            "display_name": _pick(doc, "displayName", "display_name"),
-            "mime_type": _pick(doc, "mimeType", "mime_type"),
-            "create_time": str(_pick(doc, "createTime", "create_time")) if _pick(doc, "createTime", "create_time") else None,
-            "update_time": str(_pick(doc, "updateTime", "update_time")) if _pick(doc, "updateTime", "update_time") else None,
-            "size_bytes": _as_int(_pick(doc, "sizeBytes", "size_bytes")),
-            "file_id": file_id,
-        }
+    def _fetch_stores_page(self, page_token: Optional[str] = None) -> Dict[str, Any]:
+        params: Dict[str, str] = {"pageSize": str(MAX_PAGE_SIZE)}
+        if page_token:
+            params["pageToken"] = page_token
+
+        response = self._rest_request("GET", STORES_URL, params=params)
+        response.raise_for_status()
+        return _json_loads(response)
+
+    def _normalize_stores_page(self, data: Dict[str, Any]) -> List[StoreInfo]:
+        stores = data.get("fileSearchStores") or data.get("stores") or []
+        return [self._normalize_store(store) for store in stores if isinstance(store, dict)]
 
     def _generate_content_with_file_search(
         self,
         query: str,
-        store_names: List[str],
+        stores: Tuple[str, ...],
         model: str,
         metadata_filter: Optional[str] = None,
     ) -> Dict[str, Any]:
+        # Store order does not change the answer; single-store searches need no sort
+        stores_key = stores if len(stores) < 2 else tuple(sorted(stores))
+        cache_key = (query, stores_key, metadata_filter, model)
+        with self._cache_lock:
+            cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self.logger.debug("Serving cached generateContent response")
+            return cached
+
         file_search_config: Dict[str, Any] = {
-            "file_search_store_names": store_names,
+            "file_search_store_names": list(stores),
         }
         if metadata_filter is not None:
             file_search_config["metadata_filter"] = metadata_filter
@@ -177,7 +683,12 @@ class GeminiClient:
             json_body=payload,
         )
         response.raise_for_status()
-        return response.json()
+        data = _json_loads(response)
+        # Responses are only read by the extractors, so the parsed dict is shared, not copied
+        if data.get("candidates"):
+            with self._cache_lock:
+                self._search_cache[cache_key] = data
+        return data
 
     def _extract_text_from_generate_content(self, data: Dict[str, Any]) -> str:
         candidates = data.get("candidates") or []
@@ -186,15 +697,18 @@ class GeminiClient:
         candidate = candidates[0] or {}
         content = candidate.get("content") or {}
         parts = content.get("parts") or []
-        texts = []
-        for part in parts:
-            if isinstance(part, dict) and isinstance(part.get("text"), str):
-                texts.append(part["text"])
-        return "".join(texts).strip()
+        if len(parts) == 1 and isinstance(parts[0], dict):
+            text = parts[0].get("text")
+            return text.strip() if isinstance(text, str) else ""
+        # A list comprehension feeds str.join faster than a generator (join materialises it anyway)
+        return "".join([
+            text for part in parts
+            if isinstance(part, dict) and isinstance(text := part.get("text"), str)
+        ]).strip()
 
     def _extract_citations(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         citations_out: List[Dict[str, Any]] = []
-        seen: set = set()
+        seen: Dict[Tuple[str, str], int] = {}
 
         candidates = data.get("candidates") or []
         if not candidates:
@@ -202,41 +716,39 @@ class GeminiClient:
 
         candidate = candidates[0] or {}
 
-        def add_citation(source: Optional[str], text: Optional[str]) -> None:
-            if not source and not text:
-                return
-            key = (source or "", text or "")
-            if key in seen:
-                return
-            seen.add(key)
-            entry: Dict[str, Any] = {}
-            if text is not None:
-                entry["content"] = text
-                entry["text"] = text
-            if source is not None:
-                entry["source"] = source
-            citations_out.append(entry)
-
         citation_meta = candidate.get("citationMetadata") or candidate.get("citation_metadata") or {}
         citations = citation_meta.get("citations") or []
-        for citation in citations:
-            if not isinstance(citation, dict):
-                continue
-            source = _pick(citation, "uri", "url", "source", "sourceId", "document", "name")
-            text = _pick(citation, "snippet", "text", "content", "title")
-            add_citation(source, text)
-
         grounding = candidate.get("groundingMetadata") or candidate.get("grounding_metadata") or {}
         grounding_chunks = grounding.get("groundingChunks") or grounding.get("grounding_chunks") or []
-        for chunk in grounding_chunks:
-            if not isinstance(chunk, dict):
+        contexts = (
+            chunk.get("retrievedContext") or chunk.get("retrieved_context") or {}
+            for chunk in grounding_chunks
+            if isinstance(chunk, dict)
+        )
+
+        # Citations and grounding contexts share one pass; they only differ in text key priority
+        entries = itertools.chain(
+            ((citation, _CITATION_TEXT_KEYS) for citation in citations),
+            ((context, _CONTEXT_TEXT_KEYS) for context in contexts),
+        )
+        for entry, text_keys in entries:
+            if not isinstance(entry, dict):
                 continue
-            context = chunk.get("retrievedContext") or chunk.get("retrieved_context") or {}
-            if not isinstance(context, dict):
+            source = next((entry[k] for k in _CITATION_SOURCE_KEYS if entry.get(k) is not None), None)
+            text = next((entry[k] for k in text_keys if entry.get(k) is not None), None)
+            if not source and not text:
                 continue
-            source = _pick(context, "uri", "url", "source", "sourceId", "document", "name")
-            text = _pick(context, "text", "snippet", "content", "title")
-            add_citation(source, text)
+            position = len(citations_out)
+            if seen.setdefault((source or "", text or ""), position) != position:
+                continue
+
+            citation_entry: Dict[str, Any] = {}
+            if text is not None:
+                citation_entry["content"] = text
+                citation_entry["text"] = text
+            if source is not None:
+                citation_entry["source"] = source
+            citations_out.append(citation_entry)
 
         return citations_out
 
@@ -253,45 +765,34 @@ class GeminiClient:
             Dict with success status and store information
         """
         try:
-            self.logger.info(f"Creating FileSearchStore with display_name: {display_name}")
+            self.logger.info("Creating FileSearchStore with display_name: %s", display_name)
 
-            if self._supports_file_search_stores():
+            if self._has_fss:
                 store = self.client.file_search_stores.create(
                     config={'display_name': display_name}
                 )
 
-                self.logger.info(f"FileSearchStore created successfully: {store.name}")
-                return {
-                    "success": True,
-                    "store_name": store.name,
-                    "display_name": store.display_name,
-                    "create_time": str(store.create_time) if hasattr(store, 'create_time') else None,
-                    "update_time": str(store.update_time) if hasattr(store, 'update_time') else None
-                }
+                self.logger.info("FileSearchStore created successfully: %s", store.name)
+                return {"success": True, **_store_from_sdk(store)}
 
             response = self._rest_request(
                 "POST",
-                f"{BASE_URL}/fileSearchStores",
+                STORES_URL,
                 json_body={"displayName": display_name},
             )
             response.raise_for_status()
-            store = response.json()
-            normalized = self._normalize_store(store)
+            result = {"success": True, **self._normalize_store(_json_loads(response))}
 
-            self.logger.info(f"FileSearchStore created successfully: {normalized.get('store_name')}")
-            return {
-                "success": True,
-                "store_name": normalized.get("store_name"),
-                "display_name": normalized.get("display_name"),
-                "create_time": normalized.get("create_time"),
-                "update_time": normalized.get("update_time"),
-            }
+            self.logger.info("FileSearchStore created successfully: %s", result['store_name'])
+            return result
         except Exception as e:
-            self.logger.error(f"Error creating FileSearchStore: {str(e)}", exc_info=True)
+            self._log_exception("Error creating FileSearchStore: %s", e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            self._invalidate_store()
 
     def list_file_search_stores(
         self,
@@ -307,52 +808,43 @@ class GeminiClient:
         try:
             self.logger.info("Listing all FileSearchStores")
 
-            store_list = []
+            cache_key = ("stores", page_token, all_pages)
+            cached = self._cache_get(self._list_cache, cache_key)
+            if cached is not None:
+                self.logger.info("Found %s FileSearchStores (cached)", cached['count'])
+                return cached
+
+            store_list: List[StoreInfo] = []
             next_page_token = None
 
-            if self._supports_file_search_stores() and not page_token and not all_pages:
+            if self._has_fss and not page_token and not all_pages:
                 stores = self.client.file_search_stores.list()
-                for store in stores:
-                    store_info = {
-                        "store_name": store.name,
-                        "display_name": store.display_name,
-                        "create_time": str(store.create_time) if hasattr(store, 'create_time') else None,
-                        "update_time": str(store.update_time) if hasattr(store, 'update_time') else None,
-                        "active_documents_count": int(store.active_documents_count) if (hasattr(store, 'active_documents_count') and store.active_documents_count is not None) else 0,
-                        "pending_documents_count": int(store.pending_documents_count) if (hasattr(store, 'pending_documents_count') and store.pending_documents_count is not None) else 0,
-                        "failed_documents_count": int(store.failed_documents_count) if (hasattr(store, 'failed_documents_count') and store.failed_documents_count is not None) else 0,
-                        "size_bytes": int(store.size_bytes) if (hasattr(store, 'size_bytes') and store.size_bytes is not None) else 0
-                    }
-                    store_list.append(store_info)
+                store_list = [_store_from_sdk(store) for store in stores]
+            elif not all_pages:
+                data = self._fetch_stores_page(page_token)
+                store_list = self._normalize_stores_page(data)
+                next_page_token = data.get("nextPageToken")
             else:
-                token = page_token
-                while True:
-                    params: Dict[str, str] = {}
-                    if token:
-                        params["pageToken"] = token
-
-                    response = self._rest_request("GET", f"{BASE_URL}/fileSearchStores", params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                    stores = data.get("fileSearchStores") or data.get("stores") or []
-                    for store in stores:
-                        if isinstance(store, dict):
-                            store_list.append(self._normalize_store(store))
-
-                    token = data.get("nextPageToken")
-                    next_page_token = token
-                    if not all_pages or not token:
-                        break
-
-            self.logger.info(f"Found {len(store_list)} FileSearchStores")
-            return {
+                # Request page K+1 as soon as its token is known, then normalise page K while it is in flight
+                with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                    pending = prefetcher.submit(self._fetch_stores_page, page_token)
+                    while pending is not None:
+                        data = pending.result()
+                        token = data.get("nextPageToken")
+                        pending = prefetcher.submit(self._fetch_stores_page, token) if token else None
+                        store_list.extend(self._normalize_stores_page(data))
+
+            self.logger.info("Found %s FileSearchStores", len(store_list))
+            result = {
                 "success": True,
                 "stores": store_list,
                 "count": len(store_list),
                 "next_page_token": next_page_token
             }
+            self._cache_put(self._list_cache, cache_key, result)
+            return result
         except Exception as e:
-            self.logger.error(f"Error listing FileSearchStores: {str(e)}", exc_info=True)
+            self._log_exception("Error listing FileSearchStores: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -370,43 +862,30 @@ class GeminiClient:
             Dict with success status and store information
         """
         try:
-            self.logger.info(f"Getting FileSearchStore: {store_name}")
+            self.logger.info("Getting FileSearchStore: %s", store_name)
+
+            cached = self._cache_get(self._store_cache, store_name)
+            if cached is not None:
+                self.logger.info("FileSearchStore retrieved from cache: %s", store_name)
+                return cached
 
-            if self._supports_file_search_stores():
+            if self._has_fss:
                 store = self.client.file_search_stores.get(name=store_name)
 
-                self.logger.info(f"FileSearchStore retrieved successfully: {store_name}")
-                return {
-                    "success": True,
-                    "store_name": store.name,
-                    "display_name": store.display_name,
-                    "create_time": str(store.create_time) if hasattr(store, 'create_time') else None,
-                    "update_time": str(store.update_time) if hasattr(store, 'update_time') else None,
-                    "active_documents_count": int(store.active_documents_count) if (hasattr(store, 'active_documents_count') and store.active_documents_count is not None) else 0,
-                    "pending_documents_count": int(store.pending_documents_count) if (hasattr(store, 'pending_documents_count') and store.pending_documents_count is not None) else 0,
-                    "failed_documents_count": int(store.failed_documents_count) if (hasattr(store, 'failed_documents_count') and store.failed_documents_count is not None) else 0,
-                    "size_bytes": int(store.size_bytes) if (hasattr(store, 'size_bytes') and store.size_bytes is not None) else 0
-                }
+                self.logger.info("FileSearchStore retrieved successfully: %s", store_name)
+                result = {"success": True, **_store_from_sdk(store)}
+                self._cache_put(self._store_cache, store_name, result)
+                return result
 
             response = self._rest_request("GET", f"{BASE_URL}/{store_name}")
             response.raise_for_status()
-            store = response.json()
-            normalized = self._normalize_store(store)
+            result = {"success": True, **self._normalize_store(_json_loads(response))}
 
-            self.logger.info(f"FileSearchStore retrieved successfully: {store_name}")
-            return {
-                "success": True,
-                "store_name": normalized.get("store_name"),
-                "display_name": normalized.get("display_name"),
-                "create_time": normalized.get("create_time"),
-                "update_time": normalized.get("update_time"),
-                "active_documents_count": normalized.get("active_documents_count", 0),
-                "pending_documents_count": normalized.get("pending_documents_count", 0),
-                "failed_documents_count": normalized.get("failed_documents_count", 0),
-                "size_bytes": normalized.get("size_bytes", 0),
-            }
+            self.logger.info("FileSearchStore retrieved successfully: %s", store_name)
+            self._cache_put(self._store_cache, store_name, result)
+            return result
         except Exception as e:
-            self.logger.error(f"Error getting FileSearchStore {store_name}: {str(e)}", exc_info=True)
+            self._log_exception("Error getting FileSearchStore %s: %s", store_name, e)
             return {
                 "success": False,
                 "error": str(e)
@@ -423,12 +902,12 @@ class GeminiClient:
             Dict with success status
         """
         try:
-            self.logger.info(f"Deleting FileSearchStore: {store_name}")
+            self.logger.info("Deleting FileSearchStore: %s", store_name)
 
-            if self._supports_file_search_stores():
+            if self._has_fss:
                 self.client.file_search_stores.delete(name=store_name)
 
-                self.logger.info(f"FileSearchStore deleted successfully: {store_name}")
+                self.logger.info("FileSearchStore deleted successfully: %s", store_name)
                 return {
                     "success": True,
                     "message": f"FileSearchStore {store_name} deleted successfully"
@@ -438,24 +917,26 @@ class GeminiClient:
             if response.status_code not in (200, 204):
                 error_detail = None
                 try:
-                    error_payload = response.json()
+                    error_payload = _json_loads(response)
                     error_detail = error_payload.get("error", {}).get("message")
                 except ValueError:
                     error_detail = response.text
                 message = error_detail or response.text or f"HTTP {response.status_code}"
                 raise RuntimeError(f"Delete failed: {message}")
 
-            self.logger.info(f"FileSearchStore deleted successfully: {store_name}")
+            self.logger.info("FileSearchStore deleted successfully: %s", store_name)
             return {
                 "success": True,
                 "message": f"FileSearchStore {store_name} deleted successfully"
             }
         except Exception as e:
-            self.logger.error(f"Error deleting FileSearchStore {store_name}: {str(e)}", exc_info=True)
+            self._log_exception("Error deleting FileSearchStore %s: %s", store_name, e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            self._invalidate_store(store_name)
 
     def list_documents_in_store(
         self,
@@ -475,44 +956,26 @@ class GeminiClient:
             Dict with success status and list of documents
         """
         try:
-            self.logger.info(f"Listing documents in FileSearchStore: {store_name}")
+            self.logger.info("Listing documents in FileSearchStore: %s", store_name)
 
-            document_list = []
+            cache_key = ("documents", store_name, page_size, page_token)
+            cached = self._cache_get(self._list_cache, cache_key)
+            if cached is not None:
+                self.logger.info("Found %s documents in store %s (cached)", cached['count'], store_name)
+                return cached
+
+            document_list: List[DocumentInfo] = []
             next_page_token = None
             use_rest = page_token is not None or page_size is not None
 
-            if self._supports_file_search_stores() and not use_rest:
+            if self._has_fss and not use_rest:
                 documents = self.client.file_search_stores.documents.list(
                     parent=store_name
                 )
 
-                for doc in documents:
-                    file_id = None
-                    if hasattr(doc, "file"):
-                        file_ref = getattr(doc, "file")
-                        if isinstance(file_ref, str):
-                            file_id = file_ref
-                        elif hasattr(file_ref, "name"):
-                            file_id = getattr(file_ref, "name")
-                    if not file_id and hasattr(doc, "file_id"):
-                        file_id = getattr(doc, "file_id")
-                    if not file_id and hasattr(doc, "file_name"):
-                        file_id = getattr(doc, "file_name")
-
-                    doc_info = {
-                        "document_name": doc.name if hasattr(doc, 'name') else None,
-                        "display_name": doc.display_name if hasattr(doc, 'display_name') else None,
-                        "mime_type": doc.mime_type if hasattr(doc, 'mime_type') else None,
-                        "create_time": str(doc.create_time) if hasattr(doc, 'create_time') else None,
-                        "update_time": str(doc.update_time) if hasattr(doc, 'update_time') else None,
-                        "size_bytes": doc.size_bytes if hasattr(doc, 'size_bytes') else None,
-                        "file_id": file_id,
-                    }
-                    document_list.append(doc_info)
+                document_list = [_document_from_sdk(doc) for doc in documents]
             else:
-                params: Dict[str, str] = {}
-                if page_size:
-                    params["pageSize"] = str(page_size)
+                params: Dict[str, str] = {"pageSize": str(page_size or MAX_PAGE_SIZE)}
                 if page_token:
                     params["pageToken"] = page_token
 
@@ -522,23 +985,25 @@ class GeminiClient:
                     params=params,
                 )
                 response.raise_for_status()
-                data = response.json()
+                data = _json_loads(response)
                 documents = data.get("documents") or data.get("fileSearchDocuments") or []
                 for doc in documents:
                     if isinstance(doc, dict):
                         document_list.append(self._normalize_document(doc))
                 next_page_token = data.get("nextPageToken")
 
-            self.logger.info(f"Found {len(document_list)} documents in store {store_name}")
-            return {
+            self.logger.info("Found %s documents in store %s", len(document_list), store_name)
+            result = {
                 "success": True,
                 "documents": document_list,
                 "count": len(document_list),
                 "store_name": store_name,
                 "next_page_token": next_page_token
             }
+            self._cache_put(self._list_cache, cache_key, result)
+            return result
         except Exception as e:
-            self.logger.error(f"Error listing documents in store {store_name}: {str(e)}", exc_info=True)
+            self._log_exception("Error listing documents in store %s: %s", store_name, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -557,7 +1022,7 @@ class GeminiClient:
             Dict with success status
         """
         try:
-            self.logger.info(f"Deleting document {document_name} from store {store_name}")
+            self.logger.info("Deleting document %s from store %s", document_name, store_name)
 
             document_resource = document_name
             if not document_resource.startswith("fileSearchStores/"):
@@ -567,7 +1032,7 @@ class GeminiClient:
             if response.status_code not in (200, 204):
                 error_detail = None
                 try:
-                    error_payload = response.json()
+                    error_payload = _json_loads(response)
                     error_detail = error_payload.get("error", {}).get("message")
                 except ValueError:
                     error_detail = response.text
@@ -580,7 +1045,7 @@ class GeminiClient:
                         params={"force": "true"},
                     )
                     if response.status_code in (200, 204):
-                        self.logger.info(f"Document removed successfully (force): {document_resource}")
+                        self.logger.info("Document removed successfully (force): %s", document_resource)
                         return {
                             "success": True,
                             "document_name": document_resource,
@@ -588,7 +1053,7 @@ class GeminiClient:
                         }
 
                     try:
-                        error_payload = response.json()
+                        error_payload = _json_loads(response)
                         error_detail = error_payload.get("error", {}).get("message")
                     except ValueError:
                         error_detail = response.text
@@ -596,21 +1061,20 @@ class GeminiClient:
 
                 raise RuntimeError(f"Remove failed: {message}")
 
-            self.logger.info(f"Document removed successfully: {document_resource}")
+            self.logger.info("Document removed successfully: %s", document_resource)
             return {
                 "success": True,
                 "document_name": document_resource,
                 "message": "Document removed from store"
             }
         except Exception as e:
-            self.logger.error(
-                f"Error removing document {document_name} from store {store_name}: {str(e)}",
-                exc_info=True,
-            )
+            self._log_exception("Error removing document %s from store %s: %s", document_name, store_name, e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            self._invalidate_store(store_name)
 
     # ==================== File Management Methods ====================
 
@@ -625,23 +1089,26 @@ class GeminiClient:
             Dict with success status and file information
         """
         try:
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
-                self.logger.error(f"File not found: {file_path}")
+            if not os.path.exists(file_path):
+                self.logger.error("File not found: %s", file_path)
                 return {
                     "success": False,
                     "error": f"File not found: {file_path}"
                 }
 
-            self.logger.info(f"Uploading file: {file_path}")
+            self.logger.info("Uploading file: %s", file_path)
+            _ensure_mime_types()
 
-            # Upload file using Files API - pass file path as string
+            # Upload file using Files API - pass file path as string. The SDK opens the path itself
+            # and sends it over the resumable protocol in 8 MiB chunks, so the file is never fully buffered
             uploaded_file = self.client.files.upload(
                 file=file_path,
                 config={'display_name': os.path.basename(file_path)}
             )
 
-            self.logger.info(f"File uploaded successfully: {uploaded_file.name}")
+            self._invalidate_files()
+
+            self.logger.info("File uploaded successfully: %s", uploaded_file.name)
             return {
                 "success": True,
                 "file_id": uploaded_file.name,
@@ -653,12 +1120,85 @@ class GeminiClient:
                 "uri": uploaded_file.uri if hasattr(uploaded_file, 'uri') else None
             }
         except Exception as e:
-            self.logger.error(f"Error uploading file {file_path}: {str(e)}", exc_info=True)
+            self._log_exception("Error uploading file %s: %s", file_path, e)
             return {
                 "success": False,
                 "error": str(e)
             }
 
+    def upload_file_stream(self, stream: BinaryIO, display_name: str, mime_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Upload an open binary stream to Files API without writing it to disk first
+
+        Args:
+            stream: Seekable binary stream positioned at the start of the content
+            display_name: Display name for the file; its extension selects the mime type
+            mime_type: Fallback mime type for extensions that are not recognised
+
+        Returns:
+            Dict with success status and file information
+        """
+        try:
+            self.logger.info("Uploading stream: %s", display_name)
+
+            uploaded_file = self.client.files.upload(
+                file=_sdk_stream(stream),
+                config={'display_name': display_name, 'mime_type': _stream_mime(display_name, mime_type)}
+            )
+
+            self._invalidate_files()
+
+            self.logger.info("File uploaded successfully: %s", uploaded_file.name)
+            return {"success": True, **_file_from_sdk(uploaded_file)}
+        except Exception as e:
+            self._log_exception("Error uploading stream %s: %s", display_name, e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
+    def upload_files(
+        self,
+        file_paths: List[str],
+        store_name: Optional[str] = None,
+        max_workers: int = 6,
+    ) -> Dict[str, Any]:
+        """
+        Upload several files to Files API concurrently
+
+        When store_name is given each file is imported into that store as soon as its
+        own upload finishes, so imports of early files overlap uploads of later ones.
+
+        Args:
+            file_paths: Paths of the files to upload
+            store_name: Optional FileSearchStore to import every uploaded file into
+            max_workers: Maximum number of uploads in flight at once
+
+        Returns:
+            Dict with overall success status and per-file results in input order
+        """
+        self.logger.info("Uploading %s files concurrently", len(file_paths))
+        results = self._map_concurrently(
+            self._upload_and_import_one,
+            [(file_path, store_name) for file_path in file_paths],
+            max_workers,
+        )
+        return {
+            "success": all(result.get("success") for result in results),
+            "results": results,
+            "count": len(results)
+        }
+
+    def _upload_and_import_one(self, file_path: str, store_name: Optional[str]) -> Dict[str, Any]:
+        result = self.upload_file(file_path)
+        if store_name and result.get("success"):
+            imported = self.import_file_to_store(result["file_id"], store_name)
+            if not imported.get("success"):
+                result = {**result, "success": False, "error": imported.get("error")}
+            else:
+                result["store_name"] = store_name
+        return result
+
     def import_file_to_store(self, file_id: str, store_name: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Import a file from Files API to a FileSearchStore
@@ -672,10 +1212,10 @@ class GeminiClient:
             Dict with success status
         """
         try:
-            self.logger.info(f"Importing file {file_id} to store {store_name}")
+            self.logger.info("Importing file %s to store %s", file_id, store_name)
 
             # Import file to the store
-            if self._supports_file_search_stores():
+            if self._has_fss:
                 if metadata:
                     self.client.file_search_stores.import_file(
                         store_name=store_name,
@@ -688,7 +1228,7 @@ class GeminiClient:
                         file_id=file_id
                     )
 
-                self.logger.info(f"File imported successfully to store {store_name}")
+                self.logger.info("File imported successfully to store %s", store_name)
                 return {
                     "success": True,
                     "file_id": file_id,
@@ -696,43 +1236,115 @@ class GeminiClient:
                     "message": "File imported successfully"
                 }
 
-            file_name = file_id
-            if not file_name.startswith("files/"):
-                file_name = f"files/{file_name}"
-
-            payload: Dict[str, Any] = {"fileName": file_name}
-            if metadata:
-                payload["customMetadata"] = metadata
-
-            endpoints = [
-                f"{BASE_URL}/{store_name}:importFile",
-                f"{BASE_URL}/{store_name}:import",
-            ]
-
-            last_error = None
-            for endpoint in endpoints:
-                response = self._rest_request("POST", endpoint, json_body=payload)
-                if response.ok:
-                    data = response.json() if response.content else {}
-                    operation_name = data.get("name")
-                    if operation_name:
-                        self._poll_operation(operation_name)
-                    self.logger.info(f"File imported successfully to store {store_name}")
-                    return {
-                        "success": True,
-                        "file_id": file_id,
-                        "store_name": store_name,
-                        "message": "File imported successfully"
-                    }
-                last_error = f"{response.status_code} {response.text}"
-
-            raise RuntimeError(f"Import failed: {last_error}")
+            operation_name = self._start_import(file_id, store_name, metadata)
+            if operation_name:
+                self._poll_operation(operation_name)
+
+            self.logger.info("File imported successfully to store %s", store_name)
+            return {
+                "success": True,
+                "file_id": file_id,
+                "store_name": store_name,
+                "message": "File imported successfully"
+            }
         except Exception as e:
-            self.logger.error(f"Error importing file {file_id} to store {store_name}: {str(e)}", exc_info=True)
+            self._log_exception("Error importing file %s to store %s: %s", file_id, store_name, e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            self._invalidate_store(store_name)
+
+    def import_files_bulk(
+        self,
+        imports: List[Tuple[str, str, Optional[Dict[str, Any]]]],
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> Dict[str, Any]:
+        """
+        Import several files into FileSearchStores concurrently
+
+        Args:
+            imports: (file_id, store_name, metadata) tuples to import
+            max_workers: Maximum number of imports in flight at once
+
+        Returns:
+            Dict with overall success status and per-file results in input order
+        """
+        self.logger.info("Importing %s files concurrently", len(imports))
+        results = self._map_concurrently(self.import_file_to_store, imports, max_workers)
+        return {
+            "success": all(result.get("success") for result in results),
+            "results": results,
+            "count": len(results)
+        }
+
+    def import_files_to_store(
+        self,
+        store_name: str,
+        file_ids: List[str],
+        metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Import several files into one FileSearchStore
+
+        All import requests are issued back-to-back and the resulting operations
+        are then polled together, so total time tracks the slowest import rather
+        than the sum of all of them.
+
+        Args:
+            store_name: Name of the target FileSearchStore
+            file_ids: IDs of the files to import (from Files API)
+            metadata_list: Optional metadata per file, aligned with file_ids
+
+        Returns:
+            Dict with overall success status and per-file results in input order
+        """
+        metadata_list = metadata_list or [None] * len(file_ids)
+        if len(metadata_list) != len(file_ids):
+            return {
+                "success": False,
+                "error": "metadata_list must have one entry per file id",
+                "results": []
+            }
+
+        if self._has_fss:
+            bulk = self.import_files_bulk(
+                [(file_id, store_name, metadata) for file_id, metadata in zip(file_ids, metadata_list)]
+            )
+            bulk["store_name"] = store_name
+            return bulk
+
+        self.logger.info("Importing %s files to store %s", len(file_ids), store_name)
+
+        results: List[Dict[str, Any]] = []
+        operations: Dict[int, str] = {}
+        for index, (file_id, metadata) in enumerate(zip(file_ids, metadata_list)):
+            try:
+                operation_name = self._start_import(file_id, store_name, metadata)
+                if operation_name:
+                    operations[index] = operation_name
+                results.append({"success": True, "file_id": file_id})
+            except Exception as e:
+                self.logger.error("Error importing file %s to store %s: %s", file_id, store_name, e)
+                results.append({"success": False, "file_id": file_id, "error": str(e)})
+
+        outcome = self._poll_operations(list(operations.values()))
+        self._invalidate_store(store_name)
+        for index, operation_name in operations.items():
+            error = outcome.get(operation_name)
+            if error:
+                self.logger.error("Error importing file %s to store %s: %s", results[index]['file_id'], store_name, error)
+                results[index] = {"success": False, "file_id": results[index]["file_id"], "error": error}
+
+        imported = sum(1 for result in results if result["success"])
+        self.logger.info("Imported %s/%s files to store %s", imported, len(results), store_name)
+        return {
+            "success": imported == len(results),
+            "results": results,
+            "count": len(results),
+            "store_name": store_name
+        }
 
     def upload_and_import_to_store(self, file_path: str, store_name: str, display_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -747,72 +1359,206 @@ class GeminiClient:
             Dict with success status and file information
         """
         try:
-            file_path_obj = Path(file_path)
-            if not file_path_obj.exists():
-                self.logger.error(f"File not found: {file_path}")
+            # One stat answers both "does it exist" and "how big is it"
+            try:
+                size_bytes = os.stat(file_path).st_size
+            except FileNotFoundError:
+                self.logger.error("File not found: %s", file_path)
                 return {
                     "success": False,
                     "error": f"File not found: {file_path}"
                 }
 
-            self.logger.info(f"Uploading and importing file {file_path} to store {store_name}")
+            self.logger.info("Uploading and importing file %s to store %s", file_path, store_name)
+            file_name = display_name or os.path.basename(file_path)
 
-            if self._supports_file_search_stores():
+            if self._has_fss:
+                _ensure_mime_types()
                 # Upload and import in one step - pass file path as string
                 self.client.file_search_stores.upload_to_file_search_store(
                     file=file_path,
                     file_search_store_name=store_name,
-                    config={'display_name': display_name or os.path.basename(file_path)}
+                    config={'display_name': file_name}
                 )
 
-                self.logger.info(f"File uploaded and imported successfully to store {store_name}")
+                self.logger.info("File uploaded and imported successfully to store %s", store_name)
                 return {
                     "success": True,
                     "store_name": store_name,
                     "file_path": file_path,
+                    "size_bytes": size_bytes,
                     "message": "File uploaded and imported successfully"
                 }
 
-            upload_url = f"{UPLOAD_BASE_URL}/{store_name}:uploadToFileSearchStore"
-            file_name = display_name or os.path.basename(file_path)
-            mime_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
-            extension = os.path.splitext(file_name)[1].lower()
-            if extension in {".md", ".markdown"}:
-                mime_type = "text/plain"
-            metadata = {"displayName": file_name}
-
-            with open(file_path, "rb") as file_handle:
-                files = {
-                    "metadata": ("metadata", json.dumps(metadata), "application/json"),
-                    "file": (file_name, file_handle, mime_type),
-                }
-                response = self._rest_request(
-                    "POST",
-                    upload_url,
-                    params={"uploadType": "multipart"},
-                    files=files,
-                    timeout=UPLOAD_TIMEOUT,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            operation_name = data.get("name")
+            operation_name = self._start_upload(file_path, store_name, file_name)
             if operation_name:
                 self._poll_operation(operation_name)
 
-            self.logger.info(f"File uploaded and imported successfully to store {store_name}")
+            self.logger.info("File uploaded and imported successfully to store %s", store_name)
             return {
                 "success": True,
                 "store_name": store_name,
                 "file_path": file_path,
+                "size_bytes": size_bytes,
+                "message": "File uploaded and imported successfully"
+            }
+        except Exception as e:
+            self._log_exception("Error uploading and importing file %s to store %s: %s", file_path, store_name, e)
+            return {
+                "success": False,
+                "error": str(e)
+            }
+        finally:
+            self._invalidate_store(store_name)
+
+    def upload_stream_and_import_to_store(
+        self,
+        stream: BinaryIO,
+        store_name: str,
+        display_name: str,
+        mime_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload an open binary stream and directly import it to a FileSearchStore
+
+        Args:
+            stream: Seekable binary stream positioned at the start of the content
+            store_name: Name of the target FileSearchStore
+            display_name: Display name for the file; its extension selects the mime type
+            mime_type: Fallback mime type for extensions that are not recognised
+
+        Returns:
+            Dict with success status and file information
+        """
+        try:
+            self.logger.info("Uploading and importing stream %s to store %s", display_name, store_name)
+            resolved_mime = _stream_mime(display_name, mime_type)
+
+            if self._has_fss:
+                self.client.file_search_stores.upload_to_file_search_store(
+                    file=_sdk_stream(stream),
+                    file_search_store_name=store_name,
+                    config={'display_name': display_name, 'mime_type': resolved_mime}
+                )
+            else:
+                response = self._post_upload(stream, store_name, display_name, resolved_mime)
+                response.raise_for_status()
+                operation_name = _json_loads(response).get("name")
+                if operation_name:
+                    self._poll_operation(operation_name)
+
+            self.logger.info("File uploaded and imported successfully to store %s", store_name)
+            return {
+                "success": True,
+                "store_name": store_name,
+                "display_name": display_name,
                 "message": "File uploaded and imported successfully"
             }
         except Exception as e:
-            self.logger.error(f"Error uploading and importing file {file_path} to store {store_name}: {str(e)}", exc_info=True)
+            self._log_exception("Error uploading and importing stream %s to store %s: %s", display_name, store_name, e)
             return {
                 "success": False,
                 "error": str(e)
             }
+        finally:
+            self._invalidate_store(store_name)
+
+    def upload_and_import_many(
+        self,
+        file_paths: List[str],
+        store_name: str,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> Dict[str, Any]:
+        """
+        Upload several files and import them into one FileSearchStore concurrently
+
+        Args:
+            file_paths: Paths of the files to upload
+            store_name: Name of the target FileSearchStore
+            max_workers: Maximum number of uploads in flight at once
+
+        Returns:
+            Dict with overall success status and per-file results in input order
+        """
+        self.logger.info("Uploading and importing %s files to store %s", len(file_paths), store_name)
+        results = self._map_concurrently(
+            self.upload_and_import_to_store,
+            [(file_path, store_name) for file_path in file_paths],
+            max_workers,
+        )
+        return {
+            "success": all(result.get("success") for result in results),
+            "results": results,
+            "count": len(results),
+            "store_name": store_name
+        }
+
+    def upload_and_import_batch(
+        self,
+        file_paths: List[str],
+        store_name: str,
+        batch_size: int = 32,
+        max_workers: int = MAX_CONCURRENT_REQUESTS,
+    ) -> Dict[str, Any]:
+        """
+        Upload and import files into one FileSearchStore in fixed-size batches
+
+        The upload endpoint takes a single file per request, so each batch starts its
+        uploads concurrently and then polls all of the resulting import operations
+        together. At most batch_size imports are outstanding at any time.
+
+        Args:
+            file_paths: Paths of the files to upload
+            store_name: Name of the target FileSearchStore
+            batch_size: Number of files uploaded before their imports are awaited
+            max_workers: Maximum number of uploads in flight at once
+
+        Returns:
+            Dict with overall success status and per-file results in input order
+        """
+        if self._has_fss:
+            return self.upload_and_import_many(file_paths, store_name, max_workers)
+
+        self.logger.info("Uploading and importing %s files to store %s in batches of %s", len(file_paths), store_name, batch_size)
+        results: List[Dict[str, Any]] = []
+        try:
+            for start in range(0, len(file_paths), batch_size):
+                batch = file_paths[start:start + batch_size]
+                started = self._map_concurrently(
+                    self._start_batch_upload,
+                    [(file_path, store_name) for file_path in batch],
+                    max_workers,
+                )
+                outcome = self._poll_operations(
+                    [result["operation_name"] for result in started if result.get("operation_name")]
+                )
+                for result in started:
+                    error = outcome.get(result.pop("operation_name", None))
+                    if error:
+                        self.logger.error("Error uploading and importing file %s to store %s: %s", result['file_path'], store_name, error)
+                        result.update(success=False, error=error)
+                results.extend(started)
+        finally:
+            self._invalidate_store(store_name)
+
+        imported = sum(1 for result in results if result["success"])
+        self.logger.info("Uploaded and imported %s/%s files to store %s", imported, len(results), store_name)
+        return {
+            "success": imported == len(results),
+            "results": results,
+            "count": len(results),
+            "store_name": store_name
+        }
+
+    def _start_batch_upload(self, file_path: str, store_name: str) -> Dict[str, Any]:
+        try:
+            if not os.path.isfile(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            operation_name = self._start_upload(file_path, store_name, os.path.basename(file_path))
+            return {"success": True, "file_path": file_path, "operation_name": operation_name}
+        except Exception as e:
+            self.logger.error("Error uploading file %s to store %s: %s", file_path, store_name, e)
+            return {"success": False, "file_path": file_path, "error": str(e)}
 
     def delete_file(self, file_id: str) -> Dict[str, Any]:
         """
@@ -825,18 +1571,21 @@ class GeminiClient:
             Dict with success status
         """
         try:
-            self.logger.info(f"Deleting file: {file_id}")
+            self.logger.info("Deleting file: %s", file_id)
 
-            self.client.files.delete(name=file_id)
+            try:
+                self.client.files.delete(name=file_id)
+            finally:
+                self._invalidate_files(file_id)
 
-            self.logger.info(f"File deleted successfully: {file_id}")
+            self.logger.info("File deleted successfully: %s", file_id)
             return {
                 "success": True,
                 "file_id": file_id,
                 "message": f"File {file_id} deleted successfully"
             }
         except Exception as e:
-            self.logger.error(f"Error deleting file {file_id}: {str(e)}", exc_info=True)
+            self._log_exception("Error deleting file %s: %s", file_id, e)
             return {
                 "success": False,
                 "error": str(e)
@@ -852,64 +1601,86 @@ class GeminiClient:
         try:
             self.logger.info("Listing all files")
 
-            files = self.client.files.list()
-            file_list = []
-
-            for file in files:
-                file_info = {
-                    "file_id": file.name,
-                    "display_name": file.display_name,
-                    "mime_type": file.mime_type if hasattr(file, 'mime_type') else None,
-                    "size_bytes": file.size_bytes if hasattr(file, 'size_bytes') else None,
-                    "create_time": str(file.create_time) if hasattr(file, 'create_time') else None,
-                    "update_time": str(file.update_time) if hasattr(file, 'update_time') else None,
-                    "uri": file.uri if hasattr(file, 'uri') else None
-                }
-                file_list.append(file_info)
+            cached = self._cache_get(self._file_cache, _FILES_LIST_KEY)
+            if cached is not None:
+                self.logger.info("Found %s files (cached)", cached['count'])
+                return cached
 
-            self.logger.info(f"Found {len(file_list)} files")
-            return {
+            file_list = list(self.iter_files())
+            self._remember_files(file_list)
+
+            self.logger.info("Found %s files", len(file_list))
+            result = {
                 "success": True,
                 "files": file_list,
                 "count": len(file_list)
             }
+            if all(info["state"] != "PROCESSING" for info in file_list):
+                self._cache_put(self._file_cache, _FILES_LIST_KEY, result)
+            return result
         except Exception as e:
-            self.logger.error(f"Error listing files: {str(e)}", exc_info=True)
+            self._log_exception("Error listing files: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "files": []
             }
 
-    def get_file(self, file_id: str) -> Dict[str, Any]:
+    def warm_cache(self) -> Dict[str, Any]:
+        """
+        Prefetch metadata for every uploaded file with a single list_files call
+
+        Subsequent get_file calls for listed files are then served from the cache
+        instead of issuing one Files API request each.
+
+        Returns:
+            Dict with success status and number of files cached
+        """
+        self._invalidate_files()
+        result = self.list_files()
+        result.pop("files", None)
+        return result
+
+    def iter_files(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yield metadata for every uploaded file
+
+        Pages are fetched from the Files API as the caller consumes them, so large
+        listings can be streamed without building the full list first. Errors are
+        raised to the caller; use list_files for the wrapped dict response.
+
+        Yields:
+            Dicts with the same shape as the entries of list_files
+        """
+        for file in self.client.files.list():
+            yield _file_from_sdk(file)
+
+    def get_file(self, file_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Get information about a specific file
 
         Args:
             file_id: ID of the file to retrieve
+            use_cache: Serve cached metadata when available (see warm_cache)
 
         Returns:
             Dict with success status and file information
         """
         try:
-            self.logger.info(f"Getting file info: {file_id}")
+            self.logger.info("Getting file info: %s", file_id)
 
-            file = self.client.files.get(name=file_id)
+            cached = self._cache_get(self._file_cache, file_id) if use_cache else None
+            if cached is not None:
+                self.logger.info("File info retrieved successfully: %s (cached)", file_id)
+                return cached
 
-            self.logger.info(f"File info retrieved successfully: {file_id}")
-            return {
-                "success": True,
-                "file_id": file.name,
-                "display_name": file.display_name,
-                "mime_type": file.mime_type if hasattr(file, 'mime_type') else None,
-                "size_bytes": file.size_bytes if hasattr(file, 'size_bytes') else None,
-                "create_time": str(file.create_time) if hasattr(file, 'create_time') else None,
-                "update_time": str(file.update_time) if hasattr(file, 'update_time') else None,
-                "uri": file.uri if hasattr(file, 'uri') else None,
-                "state": file.state.name if hasattr(file, 'state') else None
-            }
+            info = _file_from_sdk(self.client.files.get(name=file_id))
+            self._remember_files([info])
+
+            self.logger.info("File info retrieved successfully: %s", file_id)
+            return {"success": True, **info}
         except Exception as e:
-            self.logger.error(f"Error getting file {file_id}: {str(e)}", exc_info=True)
+            self._log_exception("Error getting file %s: %s", file_id, e)
             return {
                 "success": False,
                 "error": str(e)
@@ -937,21 +1708,24 @@ class GeminiClient:
             Dict with success status and search results
         """
         try:
-            self.logger.info(f"Searching with FileSearch in stores: {store_names}")
-            self.logger.debug(f"Query: {query}")
-            self.logger.debug(f"Metadata filter: {metadata_filter}")
+            # All stores go to a single generateContent call (the file_search tool searches them
+            # together), so the only per-store work to trim is a store listed twice
+            stores = tuple(dict.fromkeys(store_names))
+            self.logger.info("Searching with FileSearch in stores: %s", stores)
+            self.logger.debug("Query: %s", query)
+            self.logger.debug("Metadata filter: %s", metadata_filter)
 
             data = self._generate_content_with_file_search(
                 query,
-                store_names,
+                stores,
                 model,
                 metadata_filter=metadata_filter,
             )
             result_text = self._extract_text_from_generate_content(data)
             citations = self._extract_citations(data)
 
-            self.logger.info(f"Search completed successfully")
-            self.logger.debug(f"Result length: {len(result_text)} characters")
+            self.logger.info("Search completed successfully")
+            self.logger.debug("Result length: %s characters", len(result_text))
 
             return {
                 "success": True,
@@ -962,7 +1736,7 @@ class GeminiClient:
                 "model": model
             }
         except Exception as e:
-            self.logger.error(f"Error in FileSearch: {str(e)}", exc_info=True)
+            self._log_exception("Error in FileSearch: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -987,10 +1761,11 @@ class GeminiClient:
             Dict with success status and search results with grounding metadata
         """
         try:
-            self.logger.info(f"Searching with grounding in stores: {store_names}")
-            self.logger.debug(f"Query: {query}")
+            stores = tuple(dict.fromkeys(store_names))
+            self.logger.info("Searching with grounding in stores: %s", stores)
+            self.logger.debug("Query: %s", query)
 
-            data = self._generate_content_with_file_search(query, store_names, model)
+            data = self._generate_content_with_file_search(query, stores, model)
             result_text = self._extract_text_from_generate_content(data)
 
             grounding_metadata = None
@@ -1001,7 +1776,7 @@ class GeminiClient:
                 if grounding_metadata is not None:
                     grounding_metadata = str(grounding_metadata)
 
-            self.logger.info(f"Grounding search completed successfully")
+            self.logger.info("Grounding search completed successfully")
 
             return {
                 "success": True,
@@ -1012,7 +1787,7 @@ class GeminiClient:
                 "model": model
             }
         except Exception as e:
-            self.logger.error(f"Error in grounding search: {str(e)}", exc_info=True)
+            self._log_exception("Error in grounding search: %s", e)
             return {
                 "success": False,
                 "error": str(e),
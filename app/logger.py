@@ -1,12 +1,20 @@
+import atexit
 import logging
 import logging.handlers
 from pathlib import Path
 import os
+import queue
+import threading
 
 # Create logs directory
 log_dir = Path(__file__).parent.parent / 'logs'
 log_dir.mkdir(exist_ok=True)
 
+# The format below never uses thread or multiprocessing fields, so skip collecting them per record.
+# Process ids stay on: gunicorn's own log format includes %(process)d.
+logging.logThreads = False
+logging.logMultiprocessing = False
+
 # Logger setup
 logger = logging.getLogger('gemini_app')
 
@@ -17,9 +25,42 @@ if logger.hasHandlers():
 logger.setLevel(logging.DEBUG)
 logger.propagate = False  # Do not propagate to parent logger
 
+class ThrottledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that only checks the file size every `check_every` records"""
+
+    def __init__(self, *args, check_every=1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.check_every = check_every
+        self._records = 0
+
+    def shouldRollover(self, record):
+        # The size check stats/seeks the file; a log may overshoot maxBytes by < check_every records
+        self._records += 1
+        if self._records % self.check_every:
+            return False
+        return super().shouldRollover(record)
+
+class TimedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that also flushes every `flush_interval` seconds, so a quiet app's log stays current"""
+
+    def __init__(self, capacity, flush_interval=5.0, **kwargs):
+        super().__init__(capacity, **kwargs)
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        threading.Thread(target=self._flush_periodically, name='log-flush', daemon=True).start()
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self):
+        self._closed.set()
+        super().close()
+
+
 # File handler (rotating)
 log_file = log_dir / 'app.log'
-file_handler = logging.handlers.RotatingFileHandler(
+file_handler = ThrottledRotatingFileHandler(
     log_file,
     maxBytes=10 * 1024 * 1024,  # 10MB
     backupCount=5
@@ -38,9 +79,29 @@ formatter = logging.Formatter(
 file_handler.setFormatter(formatter)
 console_handler.setFormatter(formatter)
 
-# Attach handlers
-logger.addHandler(file_handler)
-logger.addHandler(console_handler)
+# Attach handlers. Request threads only enqueue records; a background listener does the
+# disk and console writes (including rotation checks) off the hot path.
+log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(log_queue))
+# The file is written in batches rather than once per record: every LOG_BUFFER_RECORDS records,
+# every 5 seconds, or straight away for a warning or worse. logging.shutdown() flushes the rest
+# at exit; LOG_BUFFER_RECORDS=1 writes each record immediately.
+buffered_file_handler = TimedMemoryHandler(
+    capacity=max(1, int(os.getenv('LOG_BUFFER_RECORDS', 128))),
+    flush_interval=5.0,
+    flushLevel=logging.WARNING,
+    target=file_handler,
+    flushOnClose=True
+)
+buffered_file_handler.setLevel(logging.DEBUG)
+listener = logging.handlers.QueueListener(
+    log_queue,
+    buffered_file_handler,
+    console_handler,
+    respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
 
 def get_logger():
     return logger
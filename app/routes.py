@@ -1,504 +1,531 @@
-from flask import Blueprint, render_template, request, jsonify, current_app
+from flask import Blueprint, render_template, request, jsonify, current_app, g, url_for
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import BaseConverter
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from pydantic import ValidationError
 from app.logger import get_logger
-from werkzeug.utils import secure_filename
+from app.schemas import CreateStoreRequest, ImportBatchRequest, ImportFileRequest, SearchRequest, validation_message
+import hashlib
+import io
 import os
+import shutil
 import tempfile
-from app.gemini_client import GeminiClient
+import threading
+import time
+import uuid
 
 bp = Blueprint('main', __name__)
+logger = get_logger()
+
+class GeminiIdConverter(BaseConverter):
+    """Gemini resource names such as 'fileSearchStores/<id>' or 'files/<id>'
+
+    Like the path converter this spans slashes and matches lazily, so
+    '<gid:store_id>/documents/<gid:document_id>' still splits at the first '/documents/';
+    the narrower character class keeps the compiled rule regex from scanning arbitrary text.
+    """
+    regex = r'[A-Za-z0-9._-][A-Za-z0-9._/-]*?'
+    part_isolating = False
+    weight = 200
+
+@bp.record_once
+def _register_converters(state):
+    state.app.url_map.converters['gid'] = GeminiIdConverter
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'pdf', 'txt', 'md', 'markdown', 'doc', 'docx', 'xlsx', 'xls', 'ppt', 'pptx', 'csv', 'json', 'xml', 'html'}
 
+_ALLOWED_SUFFIXES = tuple('.' + ext for ext in ALLOWED_EXTENSIONS)
+
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith(_ALLOWED_SUFFIXES)
+
+# Browsers may reuse file metadata responses for this long; it only changes while a file is processing
+FILE_INFO_MAX_AGE = 60
+
+def _file_info_response(payload, file_info):
+    response = jsonify(payload)
+    if file_info.get('state') != 'PROCESSING':
+        response.headers['Cache-Control'] = f'private, max-age={FILE_INFO_MAX_AGE}'
+    return response
+
+def _conditional_list_response(payload):
+    # Listings change whenever a store or file is added elsewhere, so the browser must revalidate every
+    # time; an unchanged listing then costs a 304 instead of the whole body
+    response = jsonify(payload)
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest(), weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+_client_lock = threading.Lock()
+
+def _gemini_client():
+    # One client per app, built on first use so registering the blueprint does not pull in the
+    # google-genai SDK; sharing it keeps its connection pools and metadata caches warm across requests
+    gemini = current_app.extensions.get('gemini')
+    if gemini is None:
+        with _client_lock:
+            gemini = current_app.extensions.get('gemini')
+            if gemini is None:
+                from app.gemini_client import GeminiClient
+                gemini = current_app.extensions['gemini'] = GeminiClient(current_app.config['GEMINI_API_KEY'])
+                # Prefetch file metadata off the request path so the first file lookups hit the cache
+                threading.Thread(target=gemini.warm_cache, name='gemini-warm-cache', daemon=True).start()
+    return gemini
+
+# ==================== Request Logging ====================
+# One structured record per request instead of separate "request"/"successful" lines; views add
+# domain fields (counts, names) to g.log_ctx, and URL parameters are included automatically
+
+@bp.before_request
+def _start_request_log():
+    g.request_started = time.perf_counter()
+    g.log_ctx = {}
+
+@bp.after_request
+def _emit_request_log(response):
+    record = {
+        'method': request.method,
+        'path': request.path,
+        'ip': request.remote_addr,
+        'status': response.status_code,
+        'ms': round((time.perf_counter() - g.request_started) * 1000, 1),
+        **(request.view_args or {}),
+        **g.log_ctx,
+    }
+    logger.info('%s', orjson.dumps(record, default=str).decode())
+    return response
+
+# ==================== Error Handling ====================
+# Views raise rather than catching everything themselves; these turn errors into the API's JSON shape
+
+@bp.errorhandler(ValidationError)
+def _invalid_request(e):
+    error = validation_message(e)
+    logger.warning('Invalid request - %s %s - Error: %s - IP: %s', request.method, request.path, error, request.remote_addr)
+    return jsonify({'success': False, 'error': error}), 400
+
+@bp.errorhandler(HTTPException)
+def _http_error(e):
+    # e.g. 413 when an upload exceeds MAX_CONTENT_LENGTH; a bare HTTPException() has no code
+    code = e.code or 500
+    logger.warning('Request rejected - %s %s - Status: %s - IP: %s', request.method, request.path, code, request.remote_addr)
+    return jsonify({'success': False, 'error': e.description or 'Request failed'}), code
+
+@bp.errorhandler(Exception)
+def _unexpected_error(e):
+    logger.error('Request failed - %s %s - IP: %s - Error: %s', request.method, request.path, request.remote_addr, e, exc_info=True)
+    return jsonify({'success': False, 'error': str(e)}), 500
 
 # ==================== Index Route ====================
 
 @bp.route('/')
 def index():
-    logger = get_logger()
-    logger.info(f'Index page request - IP: {request.remote_addr}')
-    try:
-        return render_template('index.html')
-    except Exception as e:
-        logger.error(f'Index page rendering failed - IP: {request.remote_addr} - Error: {str(e)}')
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return render_template('index.html')
 
 # ==================== FileSearchStore Management ====================
 
 @bp.route('/api/stores/create', methods=['POST'])
 def create_store():
     """Create a new FileSearchStore"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store creation request - IP: {client_ip}')
-
-        data = request.get_json()
-        store_name = data.get('name', '').strip()
-
-        if not store_name:
-            logger.warning(f'Store name is missing - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'Store name is required'}), 400
+    body = CreateStoreRequest.model_validate_json(request.get_data(cache=False))
+    store_name = body.name
+    g.log_ctx['name'] = store_name
 
-        logger.debug(f'Store creation attempt - Name: {store_name} - IP: {client_ip}')
+    gemini = _gemini_client()
+    result = gemini.create_file_search_store(store_name)
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.create_file_search_store(store_name)
-
-        if result['success']:
-            logger.info(f'Store creation successful - Name: {store_name} - Store ID: {result.get("store_name")} - IP: {client_ip}')
-            return jsonify(result), 201
-        else:
-            logger.error(f'Store creation failed - Name: {store_name} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'Store creation exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if result['success']:
+        return jsonify(result), 201
+    else:
+        logger.error('Store creation failed - Name: %s - Error: %s - IP: %s', store_name, result.get('error'), client_ip)
+        return jsonify(result), 400
 
 @bp.route('/api/stores', methods=['GET'])
 def list_stores():
     """List all FileSearchStores"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store list retrieval request - IP: {client_ip}')
+    page_token = request.args.get('page_token', default=None, type=str)
+    all_pages = request.args.get('all', default='false').lower() in ('1', 'true', 'yes')
 
-        page_token = request.args.get('page_token', default=None, type=str)
-        all_pages = request.args.get('all', default='false').lower() in ('1', 'true', 'yes')
+    gemini = _gemini_client()
+    result = gemini.list_file_search_stores(
+        page_token=page_token,
+        all_pages=all_pages,
+    )
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.list_file_search_stores(
-            page_token=page_token,
-            all_pages=all_pages,
-        )
+    if result['success']:
+        g.log_ctx['count'] = result.get('count', 0)
+        return _conditional_list_response(result)
+    else:
+        logger.error('Store list retrieval failed - Error: %s - IP: %s', result.get('error'), client_ip)
+        return jsonify(result), 400
 
-        if result['success']:
-            store_count = result.get('count', 0)
-            logger.info(f'Store list retrieval successful - Count: {store_count} - IP: {client_ip}')
-            logger.debug(f'Retrieved stores: {result.get("stores")} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'Store list retrieval failed - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'Store list retrieval exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/stores/<path:store_id>', methods=['GET'])
+@bp.route('/api/stores/<gid:store_id>', methods=['GET'])
 def get_store(store_id):
     """Get a specific FileSearchStore"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store retrieval request - Store ID: {store_id} - IP: {client_ip}')
+    gemini = _gemini_client()
+    result = gemini.get_file_search_store(store_id)
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.get_file_search_store(store_id)
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.warning('Store retrieval failed - Store ID: %s - Error: %s - IP: %s', store_id, result.get('error'), client_ip)
+        return jsonify(result), 404
 
-        if result['success']:
-            logger.info(f'Store retrieval successful - Store ID: {store_id} - IP: {client_ip}')
-            logger.debug(f'Store information: {result} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.warning(f'Store retrieval failed - Store ID: {store_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 404
-
-    except Exception as e:
-        logger.error(f'Store retrieval exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/stores/<path:store_id>/documents', methods=['GET'])
+@bp.route('/api/stores/<gid:store_id>/documents', methods=['GET'])
 def get_store_documents(store_id):
     """List documents in a FileSearchStore"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store document list retrieval request - Store ID: {store_id} - IP: {client_ip}')
-
-        page_token = request.args.get('page_token', default=None, type=str)
-        page_size = request.args.get('page_size', default=None, type=int)
-        if page_size is not None and page_size <= 0:
-            page_size = None
-
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.list_documents_in_store(
-            store_id,
-            page_size=page_size,
-            page_token=page_token,
-        )
-
-        if result['success']:
-            doc_count = result.get('count', 0)
-            logger.info(f'Store document list retrieval successful - Store ID: {store_id} - Count: {doc_count} - IP: {client_ip}')
-            logger.debug(f'Retrieved documents: {result.get("documents")} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'Store document list retrieval failed - Store ID: {store_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'Store retrieval exception occurred - Store ID: {store_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/stores/<path:store_id>/documents/<path:document_id>', methods=['DELETE'])
+    page_token = request.args.get('page_token', default=None, type=str)
+    page_size = request.args.get('page_size', default=None, type=int)
+    if page_size is not None and page_size <= 0:
+        page_size = None
+
+    gemini = _gemini_client()
+    result = gemini.list_documents_in_store(
+        store_id,
+        page_size=page_size,
+        page_token=page_token,
+    )
+
+    if result['success']:
+        g.log_ctx['count'] = result.get('count', 0)
+        return jsonify(result), 200
+    else:
+        logger.error('Store document list retrieval failed - Store ID: %s - Error: %s - IP: %s', store_id, result.get('error'), client_ip)
+        return jsonify(result), 400
+
+@bp.route('/api/stores/<gid:store_id>/documents/<gid:document_id>', methods=['DELETE'])
 def delete_store_document(store_id, document_id):
     """Delete a FileSearchStore document"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store document deletion request - Store ID: {store_id} - Document ID: {document_id} - IP: {client_ip}')
-
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.delete_store_document(store_id, document_id)
+    gemini = _gemini_client()
+    result = gemini.delete_store_document(store_id, document_id)
 
-        if result['success']:
-            logger.info(f'Store document deletion successful - Store ID: {store_id} - Document ID: {document_id} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'Store document deletion failed - Store ID: {store_id} - Document ID: {document_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('Store document deletion failed - Store ID: %s - Document ID: %s - Error: %s - IP: %s', store_id, document_id, result.get('error'), client_ip)
+        return jsonify(result), 400
 
-    except Exception as e:
-        logger.error(f'Store document deletion exception occurred - Store ID: {store_id} - Document ID: {document_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/stores/<path:store_id>', methods=['DELETE'])
+@bp.route('/api/stores/<gid:store_id>', methods=['DELETE'])
 def delete_store(store_id):
     """Delete a FileSearchStore"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Store deletion request - Store ID: {store_id} - IP: {client_ip}')
+    gemini = _gemini_client()
+    result = gemini.delete_file_search_store(store_id)
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.delete_file_search_store(store_id)
-
-        if result['success']:
-            logger.info(f'Store deletion successful - Store ID: {store_id} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'Store deletion failed - Store ID: {store_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'Store deletion exception occurred - Store ID: {store_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('Store deletion failed - Store ID: %s - Error: %s - IP: %s', store_id, result.get('error'), client_ip)
+        return jsonify(result), 400
 
 # ==================== File Management ====================
 
 @bp.route('/api/files/upload', methods=['POST'])
 def upload_file():
     """Upload a file (Files API)"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'File upload request - IP: {client_ip}')
+    if 'file' not in request.files:
+        logger.warning('File is missing - IP: %s', client_ip)
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
 
-        if 'file' not in request.files:
-            logger.warning(f'File is missing - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+    file = request.files['file']
+    if file.filename == '':
+        logger.warning('No filename - IP: %s', client_ip)
+        return jsonify({'success': False, 'error': 'No file selected'}), 400
 
-        file = request.files['file']
-        if file.filename == '':
-            logger.warning(f'No filename - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'No file selected'}), 400
+    if not allowed_file(file.filename):
+        logger.warning('File type not allowed - Filename: %s - IP: %s', file.filename, client_ip)
+        return jsonify({'success': False, 'error': 'File type not allowed'}), 400
 
-        if not allowed_file(file.filename):
-            logger.warning(f'File type not allowed - Filename: {file.filename} - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'File type not allowed'}), 400
+    g.log_ctx['filename'] = file.filename
 
-        logger.debug(f'File upload started - Filename: {file.filename} - IP: {client_ip}')
+    # Upload file via the Gemini Files API straight from the request stream
+    # (Werkzeug has already spooled it; no second temporary copy is needed)
+    gemini = _gemini_client()
+    result = gemini.upload_file_stream(file.stream, file.filename, file.mimetype)
 
-        # Save to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-            file.save(tmp.name)
-            tmp_path = tmp.name
+    if result['success']:
+        g.log_ctx['new_file_id'] = result.get('file_id')
+        return jsonify(result), 201
+    else:
+        logger.error('File upload failed - Filename: %s - Error: %s - IP: %s', file.filename, result.get('error'), client_ip)
+        return jsonify(result), 400
 
-        try:
-            # Upload file via the Gemini Files API
-            gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-            result = gemini.upload_file(tmp_path)
-
-            if result['success']:
-                logger.info(f'File upload successful - Filename: {file.filename} - File ID: {result.get("file_id")} - IP: {client_ip}')
-                logger.debug(f'Upload result: {result} - IP: {client_ip}')
-                return jsonify(result), 201
-            else:
-                logger.error(f'File upload failed - Filename: {file.filename} - Error: {result.get("error")} - IP: {client_ip}')
-                return jsonify(result), 400
-        finally:
-            # Remove temporary file
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
-                logger.debug(f'Temporary file deletion completed - Path: {tmp_path} - IP: {client_ip}')
-
-    except Exception as e:
-        logger.error(f'File upload exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/files/<path:file_id>/import', methods=['POST'])
+@bp.route('/api/files/<gid:file_id>/import', methods=['POST'])
 def import_file(file_id):
     """Import a file into a FileSearchStore"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'File import request - File ID: {file_id} - IP: {client_ip}')
+    body = ImportFileRequest.model_validate_json(request.get_data(cache=False))
+    store_id = body.store_id
+    metadata = body.metadata
+    g.log_ctx['target_store_id'] = store_id
 
-        data = request.get_json()
-        store_id = data.get('store_id', '').strip()
-        metadata = data.get('metadata', None)
+    gemini = _gemini_client()
+    result = gemini.import_file_to_store(file_id, store_id, metadata)
 
-        if not store_id:
-            logger.warning(f'Store ID is missing - File ID: {file_id} - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'store_id is required'}), 400
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('File import failed - File ID: %s - Store ID: %s - Error: %s - IP: %s', file_id, store_id, result.get('error'), client_ip)
+        return jsonify(result), 400
 
-        logger.debug(f'File import attempt - File ID: {file_id} - Store ID: {store_id} - Metadata: {metadata} - IP: {client_ip}')
+@bp.route('/api/stores/<gid:store_id>/import-batch', methods=['POST'])
+def import_batch(store_id):
+    """Import several files into a FileSearchStore in one call"""
+    client_ip = request.remote_addr
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.import_file_to_store(file_id, store_id, metadata)
+    body = ImportBatchRequest.model_validate_json(request.get_data(cache=False))
+    g.log_ctx['count'] = len(body.file_ids)
 
-        if result['success']:
-            logger.info(f'File import successful - File ID: {file_id} - Store ID: {store_id} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'File import failed - File ID: {file_id} - Store ID: {store_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
+    gemini = _gemini_client()
+    result = gemini.import_files_to_store(store_id, body.file_ids, body.metadata)
 
-    except Exception as e:
-        logger.error(f'File import exception occurred - File ID: {file_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('Batch file import failed - Store ID: %s - Error: %s - IP: %s', store_id, result.get('error', 'one or more imports failed'), client_ip)
+        return jsonify(result), 400
 
 @bp.route('/api/files', methods=['GET'])
 def list_files():
     """List all files"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'File list retrieval request - IP: {client_ip}')
+    gemini = _gemini_client()
+    result = gemini.list_files()
 
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.list_files()
+    if result['success']:
+        g.log_ctx['count'] = result.get('count', 0)
+        return _conditional_list_response(result)
+    else:
+        logger.error('File list retrieval failed - Error: %s - IP: %s', result.get('error'), client_ip)
+        return jsonify(result), 400
 
-        if result['success']:
-            file_count = result.get('count', 0)
-            logger.info(f'File list retrieval successful - Count: {file_count} - IP: {client_ip}')
-            logger.debug(f'Retrieved files: {result.get("files")} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'File list retrieval failed - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'File list retrieval exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
-
-@bp.route('/api/files/<path:file_id>', methods=['GET'])
+@bp.route('/api/files/<gid:file_id>', methods=['GET'])
 def get_file_info(file_id):
     """Get file info"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'File information retrieval request - File ID: {file_id} - IP: {client_ip}')
-
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.get_file(file_id)
-
-        if result['success']:
-            logger.info(f'File information retrieval successful - File ID: {file_id} - IP: {client_ip}')
-            logger.debug(f'File information: {result} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.warning(f'File information retrieval failed - File ID: {file_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 404
+    gemini = _gemini_client()
+    result = gemini.get_file(file_id)
 
-    except Exception as e:
-        logger.error(f'File information retrieval exception occurred - File ID: {file_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if result['success']:
+        return _file_info_response(result, result), 200
+    else:
+        logger.warning('File information retrieval failed - File ID: %s - Error: %s - IP: %s', file_id, result.get('error'), client_ip)
+        return jsonify(result), 404
 
-@bp.route('/api/files/<path:file_id>', methods=['DELETE'])
+@bp.route('/api/files/<gid:file_id>', methods=['DELETE'])
 def delete_file(file_id):
     """Delete a file"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'File deletion request - File ID: {file_id} - IP: {client_ip}')
-
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.delete_file(file_id)
+    gemini = _gemini_client()
+    result = gemini.delete_file(file_id)
 
-        if result['success']:
-            logger.info(f'File deletion successful - File ID: {file_id} - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'File deletion failed - File ID: {file_id} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'File deletion exception occurred - File ID: {file_id} - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('File deletion failed - File ID: %s - Error: %s - IP: %s', file_id, result.get('error'), client_ip)
+        return jsonify(result), 400
 
 # ==================== Search ====================
 
 @bp.route('/api/search', methods=['POST'])
 def search():
     """Search with FileSearch"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'Search request - IP: {client_ip}')
-
-        data = request.get_json()
-        query = data.get('query', '').strip()
-        store_ids = data.get('store_ids', [])
-        metadata_filter = data.get('metadata_filter', None)
-
-        if isinstance(metadata_filter, str):
-            metadata_filter = metadata_filter.strip()
-            if not metadata_filter:
-                metadata_filter = None
-        elif metadata_filter is not None:
-            logger.warning(f'Invalid metadata filter type - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'metadata_filter must be a string'}), 400
-
-        if not query:
-            logger.warning(f'Search query is missing - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'Query is required'}), 400
-
-        if not store_ids:
-            logger.warning(f'Store ID is missing - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'store_ids is required'}), 400
-
-        if not isinstance(store_ids, list):
-            logger.warning(f'Invalid store_ids format - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'store_ids must be an array'}), 400
-
-        logger.debug(f'Search started - Query: {query} - Stores: {store_ids} - Metadata filter: {metadata_filter} - IP: {client_ip}')
-
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        result = gemini.search_with_file_search(query, store_ids, metadata_filter)
-
-        if result['success']:
-            logger.info(f'Search successful - Query: {query} - Stores: {store_ids} - IP: {client_ip}')
-            logger.debug(f'Search result length: {len(result.get("result", ""))} characters - IP: {client_ip}')
-            return jsonify(result), 200
-        else:
-            logger.error(f'Search failed - Query: {query} - Error: {result.get("error")} - IP: {client_ip}')
-            return jsonify(result), 400
-
-    except Exception as e:
-        logger.error(f'Search exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    body = SearchRequest.model_validate_json(request.get_data(cache=False))
+    query = body.query
+    store_ids = body.store_ids
+    metadata_filter = body.metadata_filter
+    g.log_ctx.update(query=query, stores=store_ids)
+
+    gemini = _gemini_client()
+    result = gemini.search_with_file_search(query, store_ids, metadata_filter)
+
+    if result['success']:
+        return jsonify(result), 200
+    else:
+        logger.error('Search failed - Query: %s - Error: %s - IP: %s', query, result.get('error'), client_ip)
+        return jsonify(result), 400
 
 # ==================== File Preview Route ====================
 
-@bp.route('/api/files/<path:file_id>/preview', methods=['GET'])
+@bp.route('/api/files/<gid:file_id>/preview', methods=['GET'])
 def preview_file(file_id):
     """File preview/download"""
-    logger = get_logger()
-    client_ip = request.remote_addr
-    
     # Strip 'files/' from file_id to avoid duplication
     if not file_id.startswith('files/'):
         file_id = f"files/{file_id}"
-    
-    logger.info(f'File preview request - File ID: {file_id}, IP: {client_ip}')
-    try:
-        gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-        file_info = gemini.get_file(file_id)
-        
-        if not file_info.get('success'):
-            logger.warning(f'File retrieval failed - File ID: {file_id}')
-            return jsonify({'success': False, 'error': 'File not found'}), 404
-        
-        # Return file URI for direct client access
-        file_uri = file_info.get('uri')
-        if not file_uri:
-            logger.warning(f'File URI not available - File ID: {file_id}')
-            return jsonify({'success': False, 'error': 'File URI not available'}), 400
-        
-        logger.info(f'File preview information returned - File ID: {file_id}')
-        return jsonify({
-            'success': True,
-            'file_id': file_id,
-            'display_name': file_info.get('display_name'),
-            'mime_type': file_info.get('mime_type'),
-            'size_bytes': file_info.get('size_bytes'),
-            'uri': file_uri
-        }), 200
-    except Exception as e:
-        logger.error(f'File preview error occurred: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+
+    gemini = _gemini_client()
+    file_info = gemini.get_file(file_id)
+
+    if not file_info.get('success'):
+        logger.warning('File retrieval failed - File ID: %s', file_id)
+        return jsonify({'success': False, 'error': 'File not found'}), 404
+
+    # Return file URI for direct client access
+    file_uri = file_info.get('uri')
+    if not file_uri:
+        logger.warning('File URI not available - File ID: %s', file_id)
+        return jsonify({'success': False, 'error': 'File URI not available'}), 400
+
+    return _file_info_response({
+        'success': True,
+        'file_id': file_id,
+        'display_name': file_info.get('display_name'),
+        'mime_type': file_info.get('mime_type'),
+        'size_bytes': file_info.get('size_bytes'),
+        'uri': file_uri
+    }, file_info), 200
 
 # ==================== FileStore Direct Upload ====================
 
 @bp.route('/api/stores/upload', methods=['POST'])
 def upload_to_store():
     """Direct upload to FileStore (uploadToFileSearchStore)"""
-    logger = get_logger()
     client_ip = request.remote_addr
 
-    try:
-        logger.info(f'FileStore direct upload request - IP: {client_ip}')
-
-        # Validate request data
-        if 'file' not in request.files:
-            logger.warning(f'No file - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'No file provided'}), 400
+    # Validate request data
+    if 'file' not in request.files:
+        logger.warning('No file - IP: %s', client_ip)
+        return jsonify({'success': False, 'error': 'No file provided'}), 400
+
+    file = request.files['file']
+    store_name = request.form.get('store_name', '').strip()
+
+    if not file or not store_name:
+        logger.warning('File or store name is missing - IP: %s', client_ip)
+        return jsonify({'success': False, 'error': 'File and store name are required'}), 400
+
+    if not allowed_file(file.filename):
+        logger.warning('Unsupported file type - Filename: %s - IP: %s', file.filename, client_ip)
+        return jsonify({'success': False, 'error': 'File type not allowed'}), 400
+
+    g.log_ctx.update(filename=file.filename, store_name=store_name)
+    gemini = _gemini_client()
+
+    if _truthy(request.values.get('async')):
+        job_id = g.log_ctx['job_id'] = _submit_upload_job(gemini, file, store_name)
+        status_url = url_for('main.get_job', job_id=job_id)
+        return jsonify({'success': True, 'job_id': job_id, 'state': 'running', 'status_url': status_url}), 202, {'Location': status_url}
+
+    result = gemini.upload_stream_and_import_to_store(
+        stream=file.stream,
+        store_name=store_name,
+        display_name=file.filename,
+        mime_type=file.mimetype
+    )
+
+    if result['success']:
+        return jsonify(result), 201
+    else:
+        logger.error('FileStore upload failed - File: %s - Error: %s - IP: %s', file.filename, result.get('error'), client_ip)
+        return jsonify(result), 400
+
+# ==================== Background Upload Jobs ====================
+# Jobs live in this worker process (see WEB_CONCURRENCY) and are kept for an hour so clients can
+# poll them. Under the gevent worker the pool threads are greenlets, so a running upload does not
+# hold a worker connection.
+
+JOB_TTL = 3600
+MAX_UPLOAD_JOBS = 4
+COPY_BUFFER_SIZE = 1024 * 1024
+
+_jobs = TTLCache(maxsize=1024, ttl=JOB_TTL)
+_jobs_lock = threading.Lock()
+_job_executor = ThreadPoolExecutor(max_workers=MAX_UPLOAD_JOBS, thread_name_prefix='upload-job')
+
+def _truthy(value):
+    return (value or '').lower() in ('1', 'true', 'yes')
+
+def _set_job(job_id, state, result=None):
+    with _jobs_lock:
+        _jobs[job_id] = {'state': state, 'result': result}
+
+def _copy_upload(stream, dst):
+    # Uploads Werkzeug has already spooled to disk are copied in the kernel. fileno() on a
+    # SpooledTemporaryFile still held in memory would force that rollover, so those (and BytesIO)
+    # take the plain copy.
+    src_fd = None
+    if getattr(stream, '_rolled', True):
+        try:
+            src_fd = stream.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            pass
 
-        file = request.files['file']
-        store_name = request.form.get('store_name', '').strip()
+    if src_fd is not None and hasattr(os, 'sendfile'):
+        try:
+            dst_fd = dst.fileno()
+            offset, end = stream.tell(), os.fstat(src_fd).st_size
+            while offset < end:
+                sent = os.sendfile(dst_fd, src_fd, offset, end - offset)
+                if not sent:
+                    break
+                offset += sent
+            return
+        except OSError:
+            # No file-to-file sendfile on this platform (e.g. macOS); start over with a plain copy
+            dst.seek(0)
+            dst.truncate()
+    shutil.copyfileobj(stream, dst, COPY_BUFFER_SIZE)
+
+def _submit_upload_job(gemini, file, store_name):
+    # The request's upload stream is closed when the response is sent, so the job gets its own copy
+    tmp = tempfile.TemporaryFile()
+    try:
+        _copy_upload(file.stream, tmp)
+        tmp.seek(0)
+    except Exception:
+        tmp.close()
+        raise
+
+    job_id = uuid.uuid4().hex
+    _set_job(job_id, 'running')
+    _job_executor.submit(_run_upload_job, job_id, gemini, tmp, store_name, file.filename, file.mimetype)
+    return job_id
+
+def _run_upload_job(job_id, gemini, tmp, store_name, display_name, mime_type):
+    with tmp:
+        result = gemini.upload_stream_and_import_to_store(
+            stream=tmp,
+            store_name=store_name,
+            display_name=display_name,
+            mime_type=mime_type
+        )
 
-        if not file or not store_name:
-            logger.warning(f'File or store name is missing - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'File and store name are required'}), 400
+    if result['success']:
+        logger.info('Upload job completed - Job ID: %s - File: %s - Store: %s', job_id, display_name, store_name)
+    else:
+        logger.error('Upload job failed - Job ID: %s - File: %s - Error: %s', job_id, display_name, result.get('error'))
+    _set_job(job_id, 'done' if result['success'] else 'error', result)
 
-        if not allowed_file(file.filename):
-            logger.warning(f'Unsupported file type - Filename: {file.filename} - IP: {client_ip}')
-            return jsonify({'success': False, 'error': 'File type not allowed'}), 400
+@bp.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Get the state of a background upload job"""
+    with _jobs_lock:
+        job = _jobs.get(job_id)
 
-        # Save to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            file.save(tmp_file.name)
-            tmp_file_path = tmp_file.name
+    if job is None:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
 
-        try:
-            logger.debug(f'FileStore upload attempt - File: {file.filename} - Store: {store_name} - IP: {client_ip}')
-
-            gemini = GeminiClient(current_app.config['GEMINI_API_KEY'])
-            result = gemini.upload_and_import_to_store(
-                file_path=tmp_file_path,
-                store_name=store_name,
-                display_name=file.filename
-            )
-
-            if result['success']:
-                logger.info(f'FileStore upload successful - File: {file.filename} - Store: {store_name} - IP: {client_ip}')
-                return jsonify(result), 201
-            else:
-                logger.error(f'FileStore upload failed - File: {file.filename} - Error: {result.get("error")} - IP: {client_ip}')
-                return jsonify(result), 400
-
-        finally:
-            # Remove temporary file
-            if os.path.exists(tmp_file_path):
-                os.remove(tmp_file_path)
-
-    except Exception as e:
-        logger.error(f'FileStore upload exception occurred - IP: {client_ip} - Error: {str(e)}', exc_info=True)
-        return jsonify({'success': False, 'error': str(e)}), 500
+    return jsonify({'success': True, 'job_id': job_id, **job}), 200
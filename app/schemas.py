@@ -0,0 +1,101 @@
+"""
+Request body schemas for the JSON API routes
+
+Bodies are parsed and validated in one pass with ``Model.model_validate_json``;
+the error messages match the ones the routes returned before these schemas existed.
+"""
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
+from pydantic_core import PydanticCustomError
+
+
+def _invalid(message: str) -> PydanticCustomError:
+    # Tagged so validation_message() can return it to the client verbatim
+    return PydanticCustomError('invalid_request', message)
+
+
+class CreateStoreRequest(BaseModel):
+    name: str = Field(default='', validate_default=True)
+
+    @field_validator('name')
+    @classmethod
+    def _strip_name(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise _invalid('Store name is required')
+        return value
+
+
+class ImportFileRequest(BaseModel):
+    store_id: str = Field(default='', validate_default=True)
+    metadata: Optional[Dict[str, Any]] = None
+
+    @field_validator('store_id')
+    @classmethod
+    def _strip_store_id(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise _invalid('store_id is required')
+        return value
+
+
+class ImportBatchRequest(BaseModel):
+    file_ids: List[str] = Field(default_factory=list, validate_default=True)
+    metadata: Optional[List[Optional[Dict[str, Any]]]] = None
+
+    @field_validator('file_ids', mode='before')
+    @classmethod
+    def _check_file_ids(cls, value: Any) -> Any:
+        if not value:
+            raise _invalid('file_ids is required')
+        if not isinstance(value, list):
+            raise _invalid('file_ids must be an array')
+        return value
+
+    @model_validator(mode='after')
+    def _check_metadata_length(self) -> 'ImportBatchRequest':
+        if self.metadata and len(self.metadata) != len(self.file_ids):
+            raise _invalid('metadata must have one entry per file id')
+        return self
+
+
+class SearchRequest(BaseModel):
+    query: str = Field(default='', validate_default=True)
+    store_ids: List[str] = Field(default_factory=list, validate_default=True)
+    metadata_filter: Optional[str] = None
+
+    @field_validator('query')
+    @classmethod
+    def _strip_query(cls, value: str) -> str:
+        value = value.strip()
+        if not value:
+            raise _invalid('Query is required')
+        return value
+
+    @field_validator('store_ids', mode='before')
+    @classmethod
+    def _check_store_ids(cls, value: Any) -> Any:
+        if not value:
+            raise _invalid('store_ids is required')
+        if not isinstance(value, list):
+            raise _invalid('store_ids must be an array')
+        return value
+
+    @field_validator('metadata_filter', mode='before')
+    @classmethod
+    def _strip_metadata_filter(cls, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise _invalid('metadata_filter must be a string')
+        return value.strip() or None
+
+
+def validation_message(error: ValidationError) -> str:
+    """Return a single client-facing message for the first validation error"""
+    detail = error.errors(include_url=False)[0]
+    if detail['type'] == 'invalid_request':
+        return detail['msg']
+    location = '.'.join(str(part) for part in detail['loc'])
+    return f"{location}: {detail['msg']}" if location else detail['msg']
@@ -0,0 +1,106 @@
+from flask import Flask, request
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+import os
+from dotenv import load_dotenv
+from flask_compress import Compress
+import orjson
+from app.logger import get_logger
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_TEMPLATES = os.path.join(_ROOT, 'templates')
+_STATIC = os.path.join(_ROOT, 'static')
+_ENV_FILE = os.path.join(_ROOT, '.env')
+
+_STATIC_CONFIG = {
+    'MAX_CONTENT_LENGTH': 100 * 1024 * 1024,  # 100MB
+    # Listing and search responses are large, repetitive JSON; small ones are not worth compressing
+    'COMPRESS_MIMETYPES': ['application/json'],
+    'COMPRESS_ALGORITHM': ['br', 'gzip'],
+    'COMPRESS_LEVEL': 4,
+    'COMPRESS_MIN_SIZE': 1024,
+}
+
+class OrjsonProvider(JSONProvider):
+    # orjson for jsonify()/request.get_json(); anything it cannot encode natively falls back to
+    # Flask's default conversions (Decimal, __html__ objects, ...)
+    _options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._options).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand the encoded bytes straight to the response instead of round-tripping through str
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=DefaultJSONProvider.default, option=self._options | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype='application/json')
+
+_env_loaded = False
+_gemini_api_key = None
+
+def _ensure_env():
+    # Load .env and capture the API key once; later app builds reuse the cached value
+    global _env_loaded, _gemini_api_key
+    if not _env_loaded:
+        logger = get_logger()
+        if os.path.isfile(_ENV_FILE):
+            load_dotenv(_ENV_FILE)
+        _gemini_api_key = os.getenv('GEMINI_API_KEY')
+        if _gemini_api_key:
+            logger.info('Gemini API key loaded successfully')
+        else:
+            logger.warning('Gemini API key is not configured!')
+        _env_loaded = True
+
+_app_singleton = None
+
+def create_app(*, fresh=False):
+    # fresh=True builds an independent app (e.g. for an isolated test) without replacing the shared one
+    global _app_singleton
+    if fresh:
+        return _build_app()
+    if _app_singleton is None:
+        _app_singleton = _build_app()
+    return _app_singleton
+
+def _build_app():
+    logger = get_logger()
+
+    _ensure_env()
+
+    logger.info('--- Flask init: templates=%s static=%s ---', _TEMPLATES, _STATIC)
+    logger.debug('Root path: %s', _ROOT)
+
+    app = Flask(__name__, template_folder=_TEMPLATES, static_folder=_STATIC)
+    app.json = OrjsonProvider(app)
+    logger.debug('Flask app instance creation completed')
+
+    @app.after_request
+    def _cors(resp):
+        # Same policy flask-cors applied with its defaults: reflect the caller's origin and any
+        # headers it asks for in a preflight; requests without an Origin are not cross-origin
+        origin = request.headers.get('Origin')
+        if origin:
+            resp.headers['Access-Control-Allow-Origin'] = origin
+            resp.vary.add('Origin')
+            requested_headers = request.headers.get('Access-Control-Request-Headers')
+            if requested_headers:
+                resp.headers['Access-Control-Allow-Headers'] = requested_headers
+            resp.headers['Access-Control-Allow-Methods'] = 'GET, POST, DELETE, OPTIONS'
+        return resp
+    logger.debug('CORS enabled')
+
+    app.config.update(_STATIC_CONFIG)
+    app.config['GEMINI_API_KEY'] = _gemini_api_key
+    Compress(app)
+
+    # Route registration
+    from app import routes
+    app.register_blueprint(routes.bp)
+    logger.debug('API routes registered successfully')
+
+    logger.info('Flask application initialization completed')
+
+    return app
@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration for serving the app in production
+
+Every API route blocks on network calls to Gemini, so gevent workers are used:
+each worker multiplexes many in-flight requests instead of one per thread.
+The gevent worker monkey-patches the standard library before the app is
+imported, which makes the requests/httpx sockets used by GeminiClient cooperative.
+"""
+import os
+
+# wsgi_app is imported relative to the working directory; run from the repo root wherever we were started
+chdir = os.path.dirname(os.path.abspath(__file__))
+wsgi_app = "app.web:create_app()"
+bind = os.getenv("BIND", "0.0.0.0:5001")
+worker_class = "gevent"
+# One gevent worker already handles hundreds of concurrent requests. GeminiClient's metadata
+# caches live in the worker process, so extra workers would serve stale listings after a change
+# made through another worker; raise WEB_CONCURRENCY only if a single process becomes CPU-bound.
+workers = int(os.getenv("WEB_CONCURRENCY", 1))
+worker_connections = 1000
+# Uploads can take a while to stream to Gemini; keep this above UPLOAD_TIMEOUT
+timeout = 180
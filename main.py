@@ -1,8 +1,19 @@
-from app import create_app
+import importlib.util
 import os
+import sys
+
+GUNICORN_CONFIG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gunicorn.conf.py')
 
 if __name__ == '__main__':
-    app = create_app()
     # Use env var or default to set debug mode
     debug_mode = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+
+    # Serve with gunicorn + gevent workers where available (not on Windows);
+    # debug mode keeps the Flask dev server for the reloader and debugger
+    if not debug_mode and importlib.util.find_spec('gunicorn') and importlib.util.find_spec('gevent'):
+        os.execv(sys.executable, [sys.executable, '-m', 'gunicorn', '-c', GUNICORN_CONFIG])
+
+    from app.web import create_app
+
+    app = create_app()
     app.run(debug=debug_mode, host='0.0.0.0', port=5001)